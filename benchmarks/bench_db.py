@@ -0,0 +1,186 @@
+"""
+Набір бенчмарків операцій db.py на синтетичних словниках.
+
+Запуск:  python benchmarks/bench_db.py [--words 1000 10000 100000] [--lessons 50]
+                                       [--uri mongodb://...] [--json results.json]
+                                       [--compare old.json]
+Без --uri використовується mongomock: він зручний для порівняння двох версій
+коду на одній машині, але абсолютні числа варто міряти на справжньому mongod
+(агрегація get_lesson_stats на 100k слів у mongomock триває понад хвилину).
+
+Для кожного розміру словник заповнюється заново (слова рівномірно розкладені
+по --lessons уроках), після чого кожна операція виконується --repeat разів:
+  get_lesson_names (холодний і з кешу), get_lesson_stats, load_words (холодний і з кешу),
+  load_words_page, save_word, update_word, toggle_word_learned,
+  rename_lesson, delete_word, delete_words.
+Результати друкуються таблицею, а з --json записуються у файл для порівняння
+запусків; --compare показує зміну медіани відносно попереднього файлу.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db
+from connection import set_connection
+from standin import make_connection
+
+
+# Операції, що проходять усю колекцію: для них менше повторів
+FULL_SCANS = {"get_lesson_stats", "load_words_cold", "load_words_all_cold"}
+
+
+def seed(size, lessons):
+    """Заповнює базу size словами в lessons уроках; повертає (назви уроків, _id слів)."""
+    db.words_collection().drop()
+    db.lessons_collection().drop()
+    db.clear_caches()
+    names = ["Головний"] + [f"Урок {i}" for i in range(1, lessons)]
+    ids = [db.ensure_lesson_id(name) for name in names]
+    rng = random.Random(size)
+    batch = []
+    for i in range(size):
+        english = f"word{i}"
+        batch.append({
+            'english': english,
+            'english_key': english,
+            'ukrainian': f"слово{i}",
+            'learned': rng.random() < 0.3,
+            'lesson_id': ids[i % lessons],
+            'rand': rng.random(),
+        })
+        if len(batch) == 10_000:
+            db.words_collection().insert_many(batch)
+            batch = []
+    if batch:
+        db.words_collection().insert_many(batch)
+    db.ensure_indexes()
+    word_ids = [word['_id'] for word in db.words_collection().find({}, {'_id': 1})]
+    return names, word_ids
+
+
+def summarize(times):
+    ordered = sorted(times)
+    return {
+        "n": len(ordered),
+        "min_ms": ordered[0],
+        "median_ms": statistics.median(ordered),
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max_ms": ordered[-1],
+        "mean_ms": statistics.mean(ordered),
+    }
+
+
+def measure(run, repeat, prepare=None):
+    """Час run() у мілісекундах; prepare() викликається перед кожним запуском і не враховується."""
+    times = []
+    for i in range(repeat):
+        args = prepare(i) if prepare else ()
+        start = time.perf_counter()
+        run(*args)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def bench_size(size, lessons, repeat):
+    names, word_ids = seed(size, lessons)
+    rng = random.Random(1)
+    lesson = names[len(names) // 2]
+    created = []
+
+    def save(i):
+        record = db.save_word(f"new{size}_{i}", "нове", rng.choice(names))
+        created.append(record.id)
+
+    def rename(i):
+        # Туди й назад, щоб наступні операції бачили ту саму назву
+        db.rename_lesson(lesson, lesson + " *")
+        db.rename_lesson(lesson + " *", lesson)
+
+    operations = [
+        ("get_lesson_names_cold", lambda: db.get_lesson_names(), lambda i: db.invalidate_lessons() or ()),
+        ("get_lesson_names_cached", lambda: db.get_lesson_names(), None),
+        ("get_lesson_stats", lambda: db.get_lesson_stats(), None),
+        ("load_words_cold", lambda: db.load_words(lesson), lambda i: db.invalidate_words() or ()),
+        # Після холодних запусків розділ уроку вже в кеші
+        ("load_words_cached", lambda: db.load_words(lesson), None),
+        ("load_words_all_cold", lambda: db.load_words(None), lambda i: db.invalidate_words() or ()),
+        ("load_words_page", lambda: db.load_words_page(lesson), None),
+        ("save_word", save, lambda i: (i,)),
+        ("update_word", lambda word_id: db.update_word(word_id, f"upd{word_id}", "змінено", lesson),
+         lambda i: (rng.choice(word_ids),)),
+        ("toggle_word_learned", lambda word_id: db.toggle_word_learned(word_id),
+         lambda i: (rng.choice(word_ids),)),
+        ("rename_lesson", rename, lambda i: (i,)),
+        ("delete_word", lambda word_id: db.delete_word(word_id), lambda i: (created.pop(),)),
+        ("delete_words", lambda chunk: db.delete_words(chunk),
+         lambda i: ([word_ids.pop() for _ in range(10)],)),
+    ]
+    results = []
+    for name, run, prepare in operations:
+        count = max(1, repeat // 5) if name in FULL_SCANS else repeat
+        entry = {"size": size, "operation": name}
+        entry.update(summarize(measure(run, count, prepare)))
+        results.append(entry)
+        print(f"{size:>8} {name:>24} {entry['median_ms']:10.2f} {entry['p95_ms']:10.2f} {entry['n']:>5}")
+    return results
+
+
+def compare(results, path):
+    """Друкує зміну медіани відносно результатів з попереднього запуску."""
+    with open(path, encoding="utf-8") as f:
+        previous = {(r["size"], r["operation"]): r for r in json.load(f)["results"]}
+    print(f"\nПорівняння з {path}:")
+    for entry in results:
+        old = previous.get((entry["size"], entry["operation"]))
+        if old is None or not old["median_ms"]:
+            continue
+        ratio = entry["median_ms"] / old["median_ms"]
+        print(f"{entry['size']:>8} {entry['operation']:>24} {old['median_ms']:10.2f} -> "
+              f"{entry['median_ms']:10.2f} мс  ({ratio:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--lessons', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--uri', default=None)
+    parser.add_argument('--json', default=None, help="файл для результатів")
+    parser.add_argument('--compare', default=None, help="JSON попереднього запуску")
+    args = parser.parse_args()
+
+    set_connection(make_connection(args.uri))
+    print(f"{'слів':>8} {'операція':>24} {'медіана':>10} {'p95':>10} {'n':>5}")
+    results = []
+    for size in args.words:
+        results.extend(bench_size(size, args.lessons, args.repeat))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "backend": "mongod" if args.uri else "mongomock",
+            "python": platform.python_version(),
+            "lessons": args.lessons,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Результати записано у {args.json}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
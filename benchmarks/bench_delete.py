@@ -0,0 +1,93 @@
+"""
+Бенчмарк видалення слова: старий шлях (перезапис усієї колекції) проти delete_word.
+
+Запуск:  python benchmarks/bench_delete.py [--sizes 1000 10000 50000] [--uri mongodb://...]
+Без --uri використовується mongomock.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db
+from connection import set_connection
+from standin import CountingCollection, make_connection
+from word_record import english_key
+
+
+def seed(collection, size):
+    db.clear_caches()
+    collection.delete_many({})
+    lesson_id = db.ensure_lesson_id('Головний')
+    collection.insert_many([
+        {'english': f'word{i}', 'ukrainian': f'слово{i}', 'learned': False, 'lesson_id': lesson_id}
+        for i in range(size)
+    ])
+
+
+def word_id(collection, english):
+    return collection.find_one({'english': english, 'lesson_id': db.lesson_id('Головний')}, {'_id': 1})['_id']
+
+
+def save_words(collection, words):
+    """Старий save_words: очищає колекцію і вставляє кожне слово окремим insert_one."""
+    db.invalidate_words()
+    collection.delete_many({})
+    lesson_ids = {}
+    for record in words.values():
+        if record.lesson not in lesson_ids:
+            lesson_ids[record.lesson] = db.lesson_id(record.lesson)
+        collection.insert_one({
+            'english': record.english,
+            'english_key': english_key(record.english),
+            'ukrainian': record.translation,
+            'learned': record.learned,
+            'lesson_id': lesson_ids[record.lesson],
+        })
+
+
+def bench_old(collection, size):
+    """Старий шлях: load_words + save_words з повним перезаписом."""
+    words = db.load_words()
+    del words[word_id(collection, f'word{size // 2}')]
+    calls_before = collection.calls
+    start = time.perf_counter()
+    save_words(collection, words)
+    return time.perf_counter() - start, collection.calls - calls_before
+
+
+def bench_new(collection, size):
+    """Новий шлях: одне delete_one."""
+    target = word_id(collection, f'word{size // 2 + 1}')
+    calls_before = collection.calls
+    start = time.perf_counter()
+    db.delete_word(target)
+    return time.perf_counter() - start, collection.calls - calls_before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--uri', default=None)
+    parser.add_argument('--skip-old', action='store_true', help="не запускати старий шлях")
+    args = parser.parse_args()
+
+    connection = set_connection(make_connection(args.uri))
+    collection = CountingCollection(connection.words)
+    connection.words = collection
+
+    print(f"{'слів':>8} {'шлях':>12} {'час, мс':>10} {'запитів':>8}")
+    for size in args.sizes:
+        if not args.skip_old:
+            seed(collection, size)
+            elapsed, calls = bench_old(collection, size)
+            print(f"{size:>8} {'save_words':>12} {elapsed * 1000:>10.1f} {calls:>8}")
+        seed(collection, size)
+        elapsed, calls = bench_new(collection, size)
+        print(f"{size:>8} {'delete_word':>12} {elapsed * 1000:>10.1f} {calls:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Бенчмарк пошуку за фрагментом і з помилками: триграмний індекс проти перебору.
+
+Запуск:  python benchmarks/bench_fuzzy.py [--words 10000 100000] [--uri mongodb://...]
+Без --uri використовується mongomock. Запити двох видів: фрагмент перекладу з
+середини слова і англійське слово з однією помилкою. Перебір рахує ту саму
+оцінку (ngram_index.score_word) для кожного слова з load_words(), тож
+результати мають збігатися.
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db
+import ngram_index
+from bench_search import make_items
+from connection import set_connection
+from standin import make_connection
+
+
+def linear_search(words, query, limit=ngram_index.DEFAULT_LIMIT, min_score=ngram_index.MIN_SCORE):
+    query_grams = ngram_index.trigrams(query)
+    ranked = []
+    for record in words.values():
+        score = ngram_index.score_word(query, record, query_grams)
+        if score >= min_score:
+            ranked.append((-score, record.english.lower(), record.lesson, record.english))
+    ranked.sort()
+    return [entry[3] for entry in ranked[:limit]]
+
+
+def misspell(rng, word):
+    position = rng.randrange(len(word))
+    return word[:position] + rng.choice(string.ascii_lowercase) + word[position + 1:]
+
+
+def fragment(rng, text):
+    text = text.split()[0]
+    length = min(len(text), rng.randint(3, 5))
+    start = rng.randint(0, len(text) - length)
+    return text[start:start + length]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def bench(size, queries):
+    db.clear_caches()
+    collection = db.words_collection()
+    collection.delete_many({})
+    collection.insert_many([
+        {'english': record.english, 'ukrainian': record.translation, 'learned': False,
+         'lesson_id': db.ensure_lesson_id(record.lesson)}
+        for record in make_items(size)
+    ])
+
+    build_ms, _ = timed(db.search_words, "warmup")
+    words = db.load_words()
+    rng = random.Random(3)
+    items = list(words.values())
+
+    print(f"{size} слів, побудова індексу під час першого пошуку: {build_ms:.0f} мс")
+    for kind, make_query in (
+        ("фрагмент перекладу", lambda record: fragment(rng, record.translation)),
+        ("помилка в слові", lambda record: misspell(rng, record.english)),
+    ):
+        index_times, scan_times, same = [], [], 0
+        for _ in range(queries):
+            query = make_query(rng.choice(items))
+            index_ms, found = timed(db.search_words, query)
+            scan_ms, expected = timed(linear_search, words, query)
+            index_times.append(index_ms)
+            scan_times.append(scan_ms)
+            same += [record.english for record in found] == expected
+        print(f"  {kind}: індекс {statistics.mean(index_times):.2f} мс "
+              f"(макс {max(index_times):.2f}), перебір {statistics.mean(scan_times):.2f} мс, "
+              f"однакові результати {same}/{queries}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--words', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--queries', type=int, default=30)
+    parser.add_argument('--uri', default=None)
+    args = parser.parse_args()
+
+    set_connection(make_connection(args.uri))
+    for size in args.words:
+        bench(size, args.queries)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Бенчмарк пам'яті: словники деталей проти WordRecord і WordColumns.
+
+Запуск:  python benchmarks/bench_memory.py [--words 100000]
+Документи генеруються так само, як їх повертає драйвер: кожен рядок, зокрема
+назва уроку, — окремий об'єкт. tracemalloc рахує пам'ять, яка лишається
+зайнятою після побудови кожного представлення:
+  * dict     — {english: {"translation", "learned", "lesson"}}, як раніше;
+  * records  — {_id: WordRecord}, як зараз повертає load_words;
+  * columns  — WordColumns для великих списків лише для читання.
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+
+from word_record import WordColumns, WordRecord
+
+
+def documents(count):
+    for i in range(count):
+        yield {
+            '_id': ObjectId(),
+            'english': f'word{i}',
+            'ukrainian': f'слово{i}',
+            'learned': False,
+            # Новий рядок для кожного документа, як після декодування BSON
+            'lesson': ''.join(['Урок ', str(i % 20)]),
+        }
+
+
+def as_dicts(count):
+    return {
+        word['english']: {
+            "translation": word['ukrainian'],
+            "learned": word.get('learned', False),
+            "lesson": word.get('lesson', 'Головний'),
+        }
+        for word in documents(count)
+    }
+
+
+def as_records(count):
+    records = (WordRecord.from_document(word) for word in documents(count))
+    return {record.id: record for record in records}
+
+
+def as_columns(count):
+    return WordColumns(WordRecord.from_document(word) for word in documents(count))
+
+
+def measure(build, count):
+    gc.collect()
+    tracemalloc.start()
+    result = build(count)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'вигляд':>8} {'МБ':>8} {'пік, МБ':>8} {'байт/слово':>11}")
+    baseline = None
+    for name, build in (("dict", as_dicts), ("records", as_records), ("columns", as_columns)):
+        current, peak = measure(build, args.words)
+        baseline = baseline or current
+        print(f"{name:>8} {current / 2**20:8.1f} {peak / 2**20:8.1f} {current / args.words:11.0f}"
+              f"  ({current / baseline:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Бенчмарк пошуку під час введення: PrefixIndex проти перебору всіх слів.
+
+Запуск:  python benchmarks/bench_search.py [--words 100000] [--limit-ms 10]
+Для кожного префікса довжиною 1-4 літери вимірюється час пошуку, а також
+час побудови індексу і точкового оновлення одного слова. Скрипт завершується
+з кодом 1, якщо найповільніший пошук довший за --limit-ms.
+"""
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from list_model import sort_key
+from search_index import PrefixIndex
+from word_record import WordRecord
+
+UKRAINIAN = "абвгґдеєжзиіїйклмнопрстуфхцчшщьюя"
+
+
+def random_word(rng, alphabet):
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(3, 10)))
+
+
+def make_items(count, seed=1):
+    rng = random.Random(seed)
+    items = {}
+    while len(items) < count:
+        english = random_word(rng, string.ascii_lowercase)
+        translation = " ".join(random_word(rng, UKRAINIAN) for _ in range(rng.randint(1, 2)))
+        # Номер замість _id: індексу потрібна лише унікальність
+        items[english] = WordRecord(english, translation, id=len(items))
+    return sorted(items.values(), key=sort_key)
+
+
+def linear_search(items, query):
+    query = query.lower()
+    return [record for record in items
+            if record.english.lower().startswith(query) or record.translation.lower().startswith(query)]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--words', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=200, help="запитів на кожну довжину префікса")
+    parser.add_argument('--limit-ms', type=float, default=10.0)
+    args = parser.parse_args()
+
+    items = make_items(args.words)
+    build_ms, index = timed(PrefixIndex, items)
+    print(f"{args.words} слів, побудова індексу: {build_ms:.0f} мс")
+
+    rng = random.Random(2)
+    worst = 0.0
+    for length in range(1, 5):
+        prefixes = []
+        for _ in range(args.queries):
+            record = rng.choice(items)
+            source = record.english if rng.random() < 0.5 else record.translation
+            prefixes.append(source[:length])
+        index_times, scan_times, found = [], [], []
+        for prefix in prefixes:
+            elapsed, result = timed(index.search, prefix)
+            index_times.append(elapsed)
+            found.append(len(result))
+        for prefix in prefixes[:20]:
+            scan_times.append(timed(linear_search, items, prefix)[0])
+        worst = max(worst, max(index_times))
+        print(f"префікс {length}: знайдено в середньому {statistics.mean(found):.0f}, "
+              f"індекс {statistics.mean(index_times):.2f} мс (макс {max(index_times):.2f}), "
+              f"перебір {statistics.mean(scan_times):.2f} мс")
+
+    record = items[len(items) // 2]
+    update_ms, _ = timed(index.update, record.id, record.replace(translation="оновлено"))
+    print(f"оновлення одного слова: {update_ms:.2f} мс")
+
+    if worst > args.limit_ms:
+        print(f"Найповільніший пошук {worst:.2f} мс перевищує {args.limit_ms} мс")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Бенчмарк старту швидкої сесії залежно від розміру уроку.
+
+Запуск:  python benchmarks/bench_session_start.py [--words 1000 10000 30000] [--uri mongodb://...]
+Без --uri використовується mongomock, у якому $sample і сортування виконуються
+в Python, тож абсолютні числа варто міряти на справжньому mongod. Порівнюються:
+  * весь урок   — завантажити всі слова уроку і перемішати на клієнті, як раніше;
+  * $sample     — db.sample_words();
+  * rand        — db.sample_words(use_sample=False), вибірка за індексом rand.
+Для кожного способу показано медіанний час і кількість переданих документів.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db
+import scheduler
+from connection import set_connection
+from standin import make_connection
+
+LESSON = "Великий урок"
+
+
+def load_whole_lesson(lesson_name, size):
+    query = {"lesson_id": db.lesson_id(lesson_name), "learned": False}
+    words = list(db.words_collection().find(query, db.TRAINING_PROJECTION))
+    random.shuffle(words)
+    return words[:size]
+
+
+def fill(count):
+    collection = db.words_collection()
+    # Разом з індексами: вставка в колекцію з унікальним індексом у mongomock дуже повільна
+    collection.drop()
+    lesson_id = db.ensure_lesson_id(LESSON)
+    collection.insert_many([
+        {'english': f'word{i}', 'english_key': f'word{i}', 'ukrainian': f'слово{i}', 'learned': False,
+         'lesson_id': lesson_id, 'rand': db.random_key()}
+        for i in range(count)
+    ])
+    db.ensure_indexes()
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, nargs='+', default=[1_000, 10_000, 30_000])
+    parser.add_argument('--size', type=int, default=scheduler.QUICK_SESSION_SIZE)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--uri', default=None)
+    args = parser.parse_args()
+
+    set_connection(make_connection(args.uri))
+    methods = (
+        ("весь урок", lambda: load_whole_lesson(LESSON, args.size), lambda count: count),
+        ("$sample", lambda: db.sample_words(LESSON, args.size), lambda count: args.size),
+        ("rand", lambda: db.sample_words(LESSON, args.size, use_sample=False), lambda count: args.size),
+    )
+    print(f"{'слів':>8} {'спосіб':>10} {'мс':>9} {'документів':>11}")
+    for count in args.words:
+        fill(count)
+        for name, run, transferred in methods:
+            times = []
+            for _ in range(args.repeat):
+                elapsed, words = timed(run)
+                assert len(words) == args.size
+                times.append(elapsed)
+            print(f"{count:>8} {name:>10} {statistics.median(times):9.1f} {transferred(count):>11}")
+
+
+if __name__ == '__main__':
+    main()
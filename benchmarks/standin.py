@@ -0,0 +1,63 @@
+"""
+Підставна база даних для бенчмарків: mongomock або локальний mongod.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connection import Connection
+
+
+class CountingCollection:
+    """Обгортка над колекцією, що рахує звернення до бази даних."""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.calls = 0
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if not callable(attr):
+            return attr
+
+        def wrapper(*args, **kwargs):
+            self.calls += 1
+            return attr(*args, **kwargs)
+        return wrapper
+
+
+class SlowCollection(CountingCollection):
+    """Обгортка, що додає затримку до кожного звернення, імітуючи повільну базу."""
+
+    def __init__(self, collection, latency):
+        super().__init__(collection)
+        self.latency = latency
+
+    def __getattr__(self, name):
+        attr = super().__getattr__(name)
+        if not callable(attr):
+            return attr
+
+        def wrapper(*args, **kwargs):
+            time.sleep(self.latency)
+            return attr(*args, **kwargs)
+        return wrapper
+
+
+def make_connection(uri=None, database="word_trainer_bench"):
+    """Підключення до mongod за адресою uri або до mongomock, якщо uri не вказано.
+
+    Журнал офлайн-змін лежить у тимчасовій теці, щоб бенчмарки не торкались
+    журналу застосунку.
+    """
+    journal_path = os.path.join(tempfile.mkdtemp(prefix="word_trainer_bench"), "offline_journal.jsonl")
+    if uri:
+        return Connection({"uri": uri, "database": database, "journal_path": journal_path})
+    try:
+        import mongomock
+    except ImportError:
+        sys.exit("Потрібен mongomock (pip install mongomock) або --uri локального mongod")
+    return Connection({"database": database, "journal_path": journal_path}, client=mongomock.MongoClient())
@@ -0,0 +1,107 @@
+"""
+Час запуску: вартість імпорту кожного модуля і час до першого кадру.
+
+Запуск:  python benchmarks/startup_time.py [--repeat 5] [--first-frame] [--repo ../old-checkout]
+Імпорт `ui` виконується в окремому процесі з `python -X importtime`; для
+кожного модуля проєкту показано власний і сумарний (з усіма залежностями) час,
+медіану за --repeat запусків, а також найважчі сторонні модулі. Якщо під час
+імпорту `ui` завантажився pymongo, скрипт про це попереджає: драйвер має
+імпортуватися у фоні вже після появи вікна.
+
+--first-frame (потрібен дисплей, напр. xvfb-run) міряє час від запуску процесу
+до першого намальованого кадру головного меню. --repo дозволяє порівняти з
+іншою копією репозиторію.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_FRAME = """
+import sys, time
+sys.path.insert(0, {repo!r})
+import tkinter as tk
+import ui
+
+root = tk.Tk()
+app = ui.WordTrainerApp(root)
+
+def on_map(event):
+    if event.widget is root:
+        root.update()
+        print(time.time())
+        root.after(0, root.destroy)
+
+root.bind("<Map>", on_map)
+root.mainloop()
+"""
+
+
+def project_modules(repo):
+    return {name[:-3] for name in os.listdir(repo) if name.endswith(".py")}
+
+
+def import_times(repo):
+    """{модуль: (власний мс, сумарний мс)} для одного імпорту ui."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import ui"],
+                            cwd=repo, env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return times
+
+
+def first_frame_ms(repo):
+    start = time.time()
+    result = subprocess.run([sys.executable, "-c", FIRST_FRAME.format(repo=repo)],
+                            cwd=repo, capture_output=True, text=True, check=True)
+    return (float(result.stdout.split()[-1]) - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10, help="скільки сторонніх модулів показати")
+    parser.add_argument('--first-frame', action='store_true')
+    parser.add_argument('--repo', default=REPO)
+    args = parser.parse_args()
+    repo = os.path.abspath(args.repo)
+
+    import_times(repo)  # Перший запуск компілює .pyc
+    runs = [import_times(repo) for _ in range(args.repeat)]
+    names = set.intersection(*(set(run) for run in runs))
+
+    def median(name, column):
+        return statistics.median(run[name][column] for run in runs)
+
+    ours = project_modules(repo)
+    print(f"{'модуль':<28} {'власний мс':>11} {'сумарний мс':>12}")
+    for name in sorted((name for name in names if name in ours), key=lambda n: -median(n, 1)):
+        print(f"{name:<28} {median(name, 0):11.1f} {median(name, 1):12.1f}")
+
+    print("\nНайважчі сторонні модулі:")
+    third_party = [name for name in names if name not in ours and "." not in name]
+    for name in sorted(third_party, key=lambda n: -median(n, 1))[:args.top]:
+        print(f"{name:<28} {median(name, 0):11.1f} {median(name, 1):12.1f}")
+
+    if "pymongo" in names:
+        print("\nУвага: pymongo імпортується разом з ui і затримує появу вікна")
+
+    if args.first_frame:
+        frames = [first_frame_ms(repo) for _ in range(args.repeat)]
+        print(f"\nДо першого кадру: медіана {statistics.median(frames):.0f} мс, "
+              f"макс {max(frames):.0f} мс")
+
+
+if __name__ == '__main__':
+    main()
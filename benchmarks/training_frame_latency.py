@@ -0,0 +1,100 @@
+"""
+Час перемальовування екрана тренування після кожної відповіді.
+
+Запуск:  xvfb-run python benchmarks/training_frame_latency.py [--answers 500]
+Щоб порівняти з попередньою версією, вкажіть теку іншої копії репозиторію:
+
+    git worktree add /tmp/before <коміт>
+    xvfb-run python benchmarks/training_frame_latency.py --repo /tmp/before
+
+Скрипт повторює те, що робить перевірка відповіді: змінює стан тренування,
+викликає training_ui() і чекає, поки Tk обробить геометрію та перемалює
+вікно. Окремо вимірюються перехід до наступного слова і неправильна спроба
+(з підказкою).
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tkinter as tk
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def measure(root, app, steps, step):
+    timings = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        step()
+        app.training_ui()
+        root.update_idletasks()
+        root.update()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--answers', type=int, default=500, help="кількість кроків кожного виду")
+    parser.add_argument('--repo', default=os.path.dirname(BENCH_DIR),
+                        help="тека з ui.py, яку треба виміряти")
+    args = parser.parse_args()
+
+    repo = os.path.abspath(args.repo)
+    sys.path.insert(0, repo)
+    # ui і connection імпортуються з --repo раніше за standin, бо standin
+    # додає на початок sys.path поточну копію репозиторію
+    import ui
+    from connection import set_connection
+    from standin import make_connection
+    # Модулі, які ui імпортує пізніше, теж мають братися з --repo
+    sys.path.insert(0, repo)
+    print(f"Вимірюється {ui.__file__}")
+
+    set_connection(make_connection())
+
+    root = tk.Tk()
+    app = ui.WordTrainerApp(root)
+    root.update()
+
+    # Слів більше, ніж кроків, щоб тренування не завершилось під час вимірювання
+    app.training_mode = "EN-UA"
+    app.training_data = [
+        {'english': f'word{i}', 'ukrainian': f'слово{i}', 'learned': False,
+         'lesson': 'Головний' if i % 2 else 'Урок 1'}
+        for i in range(args.answers + 2)
+    ]
+    app.training_index = 0
+    app.attempts_count = 0
+    app.training_ui()
+    root.update()
+
+    def next_word():
+        app.training_index += 1
+        app.attempts_count = 0
+
+    def wrong_attempt():
+        app.attempts_count += 1
+
+    results = {
+        "наступне слово": measure(root, app, args.answers, next_word),
+        "неправильна спроба": measure(root, app, args.answers, wrong_attempt),
+    }
+    root.destroy()
+
+    print(f"ui.py з {os.path.abspath(args.repo)}")
+    for name, timings in results.items():
+        print(f"{name:>20}: середнє {statistics.mean(timings):.2f} мс, "
+              f"p95 {percentile(timings, 0.95):.2f} мс, макс {max(timings):.2f} мс")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Перевірка, що вікно не зависає, поки база даних відповідає повільно.
+
+Запуск:  python benchmarks/ui_responsiveness.py [--latency 0.5]
+Потрібен дисплей (під CI: xvfb-run python benchmarks/ui_responsiveness.py).
+Кожне звернення до підставної бази затримується на --latency секунд. Поки
+відкриваються екрани, таймер Tk кожні 10 мс фіксує, наскільки пізно він
+спрацював. Найбільша затримка має бути значно меншою за затримку бази.
+"""
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from connection import set_connection
+from standin import SlowCollection, make_connection
+
+TICK_MS = 10
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--latency', type=float, default=0.5, help="затримка бази, с")
+    parser.add_argument('--words', type=int, default=2000)
+    parser.add_argument('--max-gap-ms', type=float, default=100.0,
+                        help="допустима найбільша пауза головного циклу")
+    args = parser.parse_args()
+
+    connection = set_connection(make_connection())
+    lesson_id = connection.lessons.insert_one({"name": "Головний", "description": ""}).inserted_id
+    connection.words.insert_many([
+        {'english': f'word{i}', 'ukrainian': f'слово{i}', 'learned': False, 'lesson_id': lesson_id}
+        for i in range(args.words)
+    ])
+    connection.lessons = SlowCollection(connection.lessons, args.latency)
+    connection.words = SlowCollection(connection.words, args.latency)
+
+    from ui import WordTrainerApp
+
+    root = tk.Tk()
+    app = WordTrainerApp(root)
+    gaps = []
+    last_tick = [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        gaps.append(now - last_tick[0])
+        last_tick[0] = now
+        root.after(TICK_MS, tick)
+
+    # Відкриваємо екрани, кожен з яких звертається до бази
+    steps = [app.show_dictionary, app.show_learned_words, app.select_mode, app.add_word_ui]
+    delay = 0
+    for step in steps:
+        root.after(delay, step)
+        delay += int(args.latency * 3000)
+    root.after(delay, root.quit)
+    root.after(TICK_MS, tick)
+    root.mainloop()
+    app.db_executor.shutdown()
+    root.destroy()
+
+    max_gap_ms = (max(gaps) - TICK_MS / 1000) * 1000
+    print(f"Затримка бази: {args.latency * 1000:.0f} мс")
+    print(f"Запитів до бази: {connection.lessons.calls + connection.words.calls}")
+    print(f"Найбільша пауза головного циклу: {max_gap_ms:.1f} мс")
+    if max_gap_ms > args.max_gap_ms:
+        print("Вікно блокувалося під час запиту до бази")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
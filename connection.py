@@ -0,0 +1,149 @@
+"""
+Підключення до MongoDB.
+
+Клієнт створюється лише при першому зверненні до бази. Налаштування беруться
+з файлу config.json (або з файлу, вказаного у WORD_TRAINER_CONFIG), а змінні
+оточення мають пріоритет над файлом:
+
+    WORD_TRAINER_MONGO_URI          адреса сервера
+    WORD_TRAINER_DB                 назва бази даних
+    WORD_TRAINER_POOL_SIZE          максимальний розмір пулу з'єднань
+    WORD_TRAINER_TIMEOUT_MS         serverSelectionTimeoutMS
+    WORD_TRAINER_COMPRESSORS        стиснення, напр. "zstd,zlib"
+    WORD_TRAINER_JOURNAL            файл журналу змін, зроблених без підключення;
+                                    типово свій для кожної пари адреса + база
+
+Тести та бенчмарки можуть підставити власне підключення через set_connection().
+"""
+import hashlib
+import json
+import os
+from functools import cached_property
+
+DEFAULT_CONFIG = {
+    "uri": "mongodb://localhost:27017/",
+    "database": "My_english",
+    # Назви збігаються з колекціями, які програма використовувала раніше,
+    # тому наявні дані залишаються доступними
+    "lessons_collection": "word_trainer.lessons",
+    "words_collection": "word_trainer.words",
+    "review_log_collection": "word_trainer.review_log",
+    # Службові позначки, напр. які доповнення старих документів уже виконано
+    "meta_collection": "word_trainer.meta",
+    "max_pool_size": 10,
+    "server_selection_timeout_ms": 3000,
+    "compressors": None,
+    # Зміни, які не вдалося записати, бо сервер недоступний (див. write_journal.py);
+    # None — файл поруч із програмою, окремий для кожної бази
+    "journal_path": None,
+}
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(APP_DIR, "config.json")
+
+ENV_VARS = {
+    "WORD_TRAINER_MONGO_URI": ("uri", str),
+    "WORD_TRAINER_DB": ("database", str),
+    "WORD_TRAINER_POOL_SIZE": ("max_pool_size", int),
+    "WORD_TRAINER_TIMEOUT_MS": ("server_selection_timeout_ms", int),
+    "WORD_TRAINER_COMPRESSORS": ("compressors", str),
+    "WORD_TRAINER_JOURNAL": ("journal_path", str),
+}
+
+
+def load_config(path=None, environ=None):
+    """Збирає налаштування з типових значень, файлу та змінних оточення."""
+    environ = os.environ if environ is None else environ
+    config = dict(DEFAULT_CONFIG)
+
+    path = path or environ.get("WORD_TRAINER_CONFIG") or CONFIG_PATH
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            config.update(json.load(f))
+
+    for var, (key, convert) in ENV_VARS.items():
+        if environ.get(var):
+            config[key] = convert(environ[var])
+    return config
+
+
+class Connection:
+    """Ліниве підключення до бази даних з доступом до колекцій програми."""
+
+    def __init__(self, config=None, client=None):
+        self.config = dict(DEFAULT_CONFIG)
+        if config:
+            self.config.update(config)
+        self._client = client
+
+    @property
+    def journal_path(self):
+        """Файл журналу офлайн-змін саме для цієї бази.
+
+        Журнал застосовується до тієї бази, з якою працює підключення, тож інша
+        база (наприклад, у бенчмарках) ніколи не отримає чужих змін.
+        """
+        if self.config.get("journal_path"):
+            return self.config["journal_path"]
+        target = "\n".join((self.config["uri"], self.config["database"], self.config["words_collection"]))
+        digest = hashlib.sha1(target.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(APP_DIR, f"offline_journal-{digest}.jsonl")
+
+    @property
+    def client(self):
+        if self._client is None:
+            from pymongo import MongoClient
+
+            options = {
+                "maxPoolSize": self.config["max_pool_size"],
+                "serverSelectionTimeoutMS": self.config["server_selection_timeout_ms"],
+            }
+            if self.config.get("compressors"):
+                options["compressors"] = self.config["compressors"]
+            self._client = MongoClient(self.config["uri"], **options)
+        return self._client
+
+    @cached_property
+    def database(self):
+        return self.client[self.config["database"]]
+
+    @cached_property
+    def lessons(self):
+        return self.database[self.config["lessons_collection"]]
+
+    @cached_property
+    def words(self):
+        return self.database[self.config["words_collection"]]
+
+    @cached_property
+    def review_log(self):
+        return self.database[self.config["review_log_collection"]]
+
+    @cached_property
+    def meta(self):
+        return self.database[self.config["meta_collection"]]
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        for name in ("database", "lessons", "words", "review_log", "meta"):
+            self.__dict__.pop(name, None)
+
+
+_connection = None
+
+
+def get_connection():
+    """Повертає спільне підключення, створюючи його за потреби."""
+    global _connection
+    if _connection is None:
+        _connection = Connection(load_config())
+    return _connection
+
+
+def set_connection(connection):
+    """Підставляє інше підключення (наприклад, mongomock у тестах)."""
+    global _connection
+    _connection = connection
+    return connection
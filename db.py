@@ -1,183 +1,850 @@
-from pymongo import MongoClient
 from datetime import datetime
+import logging
+import random
+import threading
+import metrics
+from connection import get_connection
+from word_cache import WordCache
+from word_record import DEFAULT_LESSON, WordRecord, english_key
+from write_journal import WriteJournal
+# pymongo та indexes імпортуються у функціях: так вікно з'являється до того,
+# як завантажиться драйвер (див. benchmarks/startup_time.py)
+import ngram_index
+import scheduler
 
-client = MongoClient('mongodb://localhost:27017/')
-db = client['My_english']
-word_trainer = db['word_trainer']
-lessons_collection = word_trainer['lessons']
-words_collection = word_trainer['words']
+logger = logging.getLogger(__name__)
 
-def get_lessons():
+def _fail(message, error, exc_info=False):
+    """Пише помилку в журнал і зараховує її операції, що виконується."""
+    logger.error("%s: %s", message, error, exc_info=exc_info)
+    metrics.failed()
+
+def lessons_collection():
+    """Колекція уроків поточного підключення."""
+    return get_connection().lessons
+
+def words_collection():
+    """Колекція слів поточного підключення."""
+    return get_connection().words
+
+def review_log_collection():
+    """Колекція журналу відповідей поточного підключення."""
+    return get_connection().review_log
+
+def meta_collection():
+    """Службова колекція поточного підключення."""
+    return get_connection().meta
+
+@metrics.timed("ensure_indexes")
+def ensure_indexes():
+    """Створює індекси колекцій, якщо їх ще немає, і доповнює старі документи."""
+    try:
+        import indexes
+
+        # Старі індекси за назвою уроку заважали б міграції на lesson_id
+        indexes.drop_obsolete_indexes(words_collection())
+        migrate_lesson_ids()
+        failed = indexes.ensure_indexes(lessons_collection(), words_collection())
+        ensure_english_keys()
+        ensure_random_keys()
+        if failed:
+            # Найчастіше це дублікати, які не дають створити унікальний індекс
+            _fail("Не вдалося створити індекси", ", ".join(failed))
+            return False
+        return True
+    except Exception as e:
+        _fail("Помилка при створенні індексів", e)
+        return False
+
+def warm_up():
+    """Підключається до бази, готує індекси і кеш уроків; виконується у фоні після старту."""
+    ensure_indexes()
+    get_lesson_names()
+    # Зміни, зроблені минулого разу без підключення
+    drain_journal()
+
+def _backfill(field, make_value, batch_size):
+    """Пачками додає поле field словам, у яких його ще немає; повертає кількість слів.
+
+    Слова проходяться один раз у порядку _id, як у migrate_lesson_ids. Після
+    завершення в службовій колекції лишається позначка, тож наступні запуски
+    не сканують колекцію слів: нові слова db.py та importer.py зберігають
+    одразу з цим полем.
+    """
+    from pymongo import UpdateOne
+
+    marker = {'_id': f'backfill_{field}'}
+    if meta_collection().find_one(marker):
+        return 0
+    updated = 0
+    last_id = None
+    while True:
+        query = {field: {'$exists': False}}
+        if last_id is not None:
+            query['_id'] = {'$gt': last_id}
+        words = list(words_collection().find(query, {'_id': 1, 'english': 1}).sort('_id', 1).limit(batch_size))
+        if not words:
+            break
+        words_collection().bulk_write([
+            UpdateOne({'_id': word['_id']}, {'$set': {field: make_value(word)}})
+            for word in words
+        ], ordered=False)
+        updated += len(words)
+        last_id = words[-1]['_id']
+    meta_collection().update_one(marker, {'$set': {'done_at': datetime.now()}}, upsert=True)
+    return updated
+
+def ensure_english_keys(batch_size=1000):
+    """Додає english_key словам, збереженим до появи посторінкового перегляду."""
+    return _backfill('english_key', lambda word: english_key(word['english']), batch_size)
+
+def random_key():
+    """Випадковий ключ слова для вибірки без $sample."""
+    return random.random()
+
+def ensure_random_keys(batch_size=1000):
+    """Додає випадковий ключ rand словам, збереженим до появи швидких сесій."""
+    return _backfill('rand', lambda word: random_key(), batch_size)
+
+# Реєстр уроків [(назва, _id)] у порядку відображення; None означає, що кеш треба заповнити.
+# Слова посилаються на урок через lesson_id, а назва береться з реєстру.
+_lessons = None
+
+def invalidate_lessons():
+    """Скидає кеш уроків після зміни колекції уроків."""
+    global _lessons
+    _lessons = None
+
+def _lesson_sort_key(lesson):
+    # Уроки без дати створення йдуть у кінці
+    return (0 if lesson['name'] == 'Головний' else 1, lesson.get('created_at') or datetime.max)
+
+def _lesson_registry():
+    global _lessons
+    if _lessons is None:
+        lessons = list(lessons_collection().find({}, {'_id': 1, 'name': 1, 'created_at': 1}))
+        lessons.sort(key=_lesson_sort_key)
+        _lessons = [(lesson['name'], lesson['_id']) for lesson in lessons]
+    return _lessons
+
+@metrics.timed("get_lesson_names", docs=len)
+def get_lesson_names():
+    """Повертає назви уроків: спочатку "Головний", далі за датою створення."""
     try:
-        lessons = list(lessons_collection.find())
-        lessons.sort(key=lambda x: (0 if x['name'] == 'Головний' else 1, x.get('created_at', datetime.now())))
-        return lessons
+        return [name for name, _ in _lesson_registry()]
     except Exception as e:
-        print(f"Помилка при отриманні уроків: {e}")
+        _fail("Помилка при отриманні уроків", e)
         return []
 
+def _refresh_lessons():
+    """Перечитує реєстр уроків: урок міг створити інший процес, наприклад importer.py."""
+    invalidate_lessons()
+    return _lesson_registry()
+
+def lesson_id(lesson_name):
+    """_id уроку з такою назвою або None; невідому назву шукає ще й у свіжому реєстрі."""
+    for registry in (_lesson_registry, _refresh_lessons):
+        for name, id_ in registry():
+            if name == lesson_name:
+                return id_
+    return None
+
+class _LessonNames(dict):
+    """{_id уроку: назва}; невідомий _id один раз перечитує реєстр уроків."""
+
+    def __init__(self):
+        super().__init__((id_, name) for name, id_ in _lesson_registry())
+        self._refreshed = False
+
+    def get(self, id_, default=None):
+        if id_ is not None and id_ not in self and not self._refreshed:
+            self._refreshed = True
+            self.update((i, name) for name, i in _refresh_lessons())
+            if id_ not in self:
+                logger.warning("Урок %s не знайдено навіть у свіжому реєстрі уроків", id_)
+        return super().get(id_, default)
+
+def lesson_names_by_id():
+    """{_id уроку: назва} для перетворення lesson_id слів у назви.
+
+    Якщо в словах трапиться _id, якого немає в реєстрі, реєстр один раз за
+    виклик перечитується; лише слова уроку, якого немає й там, потрапляють
+    у "Головний".
+    """
+    return _LessonNames()
+
+def ensure_lesson_id(lesson_name):
+    """_id уроку; урок створюється, якщо його ще немає."""
+    id_ = lesson_id(lesson_name)
+    if id_ is None:
+        create_lesson(lesson_name)
+        id_ = lesson_id(lesson_name)
+    return id_
+
+def _match_lesson(query, lesson_name):
+    """Додає до запиту умову на урок; None і "Всі уроки" означають усі уроки."""
+    if lesson_name is not None and lesson_name != "Всі уроки":
+        id_ = lesson_id(lesson_name)
+        # В уроці, якого немає в реєстрі, немає й слів
+        query["lesson_id"] = id_ if id_ is not None else {'$in': []}
+    return query
+
+def _record(word, names):
+    """WordRecord з документа слова; names — результат lesson_names_by_id()."""
+    return WordRecord.from_document(word, lesson=names.get(word.get('lesson_id'), DEFAULT_LESSON))
+
+@metrics.timed("migrate_lesson_ids", docs=int)
+def migrate_lesson_ids(batch_size=1000):
+    """Замінює назву уроку в словах на lesson_id; повертає кількість змінених слів.
+
+    Слова обробляються пачками в порядку _id, кожне оновлення атомарне і
+    стосується лише слів без lesson_id, тож перервану міграцію можна просто
+    запустити ще раз. Уроки, яких немає в колекції уроків, створюються; слова
+    уроку, який створити не вдалося, лишаються як є до наступного запуску.
+    """
+    from pymongo import UpdateOne
+
+    ids = {}
+    updated = 0
+    last_id = None
+    while True:
+        query = {'lesson_id': {'$exists': False}}
+        if last_id is not None:
+            query['_id'] = {'$gt': last_id}
+        words = list(words_collection().find(query, {'_id': 1, 'lesson': 1}).sort('_id', 1).limit(batch_size))
+        if not words:
+            return updated
+        requests = []
+        for word in words:
+            name = word.get('lesson') or DEFAULT_LESSON
+            if name not in ids:
+                ids[name] = ensure_lesson_id(name)
+                if ids[name] is None:
+                    logger.error("Не вдалося отримати _id уроку %s: його слова лишаються зі старою назвою", name)
+            if ids[name] is None:
+                # Назва уроку — єдине, що пов'язує слово з уроком; без _id її не прибираємо
+                continue
+            requests.append(UpdateOne(
+                {'_id': word['_id'], 'lesson_id': {'$exists': False}},
+                {'$set': {'lesson_id': ids[name]}, '$unset': {'lesson': ''}}
+            ))
+        if requests:
+            words_collection().bulk_write(requests, ordered=False)
+        updated += len(requests)
+        last_id = words[-1]['_id']
+
+@metrics.timed("get_lesson_stats")
+def get_lesson_stats():
+    """Кількість слів кожного уроку: {урок: {"total": n, "learned": m}}.
+
+    Рахує сервер одним агрегаційним запитом; документи слів не передаються.
+    """
+    pipeline = [
+        {'$group': {
+            '_id': {
+                'lesson_id': '$lesson_id',
+                'learned': {'$ifNull': ['$learned', False]},
+            },
+            'count': {'$sum': 1},
+        }},
+    ]
+    try:
+        stats = {}
+        names = lesson_names_by_id()
+        for group in words_collection().aggregate(pipeline):
+            # У $group немає lesson_id для слів, які ще не вдалося мігрувати
+            lesson_name = names.get(group['_id'].get('lesson_id'))
+            if lesson_name is None:
+                # Такі слова не належать жодному уроку зі списку; не додаємо їх до "Головний"
+                continue
+            counts = stats.setdefault(lesson_name, {"total": 0, "learned": 0})
+            counts["total"] += group['count']
+            if group['_id']['learned']:
+                counts["learned"] += group['count']
+        return stats
+    except Exception as e:
+        _fail("Помилка при підрахунку слів уроків", e)
+        return {}
+
+# Кеш слів і триграмний індекс, які оновлюють усі функції запису нижче
+_word_cache = WordCache()
+_ngram_index = ngram_index.TrigramIndex()
+
+def invalidate_words(lesson_name=None):
+    """Скидає кеш слів уроку або весь кеш, якщо слова змінено в обхід db.py."""
+    _word_cache.invalidate(lesson_name)
+    if lesson_name is None:
+        _ngram_index.invalidate()
+
+def _add_to_caches(record):
+    _word_cache.add_word(record)
+    _ngram_index.add_word(record)
+
+def _remove_from_caches(word_id):
+    _word_cache.remove_word(word_id)
+    _ngram_index.remove_word(word_id)
+
+def _cached_lesson_id(lesson_name):
+    """_id уроку з кешу реєстру, без звернення до бази; None, якщо його там немає."""
+    for name, id_ in _lessons or ():
+        if name == lesson_name:
+            return id_
+    return None
+
+def clear_caches():
+    """Очищає всі кеші, наприклад після підключення до іншої бази."""
+    invalidate_lessons()
+    invalidate_words()
+
+# Поля, потрібні для WordRecord; решту документа сервер не надсилає
+WORD_PROJECTION = {'_id': 1, 'english': 1, 'ukrainian': 1, 'learned': 1, 'lesson_id': 1}
+DEFAULT_BATCH_SIZE = 1000
+
+def iter_words(lesson_name=None, learned=False, batch_size=DEFAULT_BATCH_SIZE, limit=0, skip=0):
+    """Генератор записів WordRecord без проміжних словників і списків.
+
+    learned=None повертає і вивчені, і невивчені слова. Документи читаються
+    пачками по batch_size; помилки бази передаються тому, хто читає генератор.
+    """
+    query = _match_lesson({}, lesson_name)
+    if learned is not None:
+        query["learned"] = learned
+    names = lesson_names_by_id()
+    cursor = words_collection().find(query, WORD_PROJECTION).batch_size(batch_size)
+    if skip:
+        cursor = cursor.skip(skip)
+    if limit:
+        cursor = cursor.limit(limit)
+    for word in cursor:
+        yield _record(word, names)
+
+@metrics.timed("load_words", docs=len)
 def load_words(lesson_name=None, show_learned=False):
+    if lesson_name == "Всі уроки":
+        lesson_name = None
+    learned = True if show_learned else False
+    cached = _word_cache.get(lesson_name, learned)
+    if cached is not None:
+        return cached
     try:
-        words = {}
-        
-        if lesson_name is None or lesson_name == "Всі уроки":
-            # Завантажуємо всі слова
-            query = {"learned": True if show_learned else False}
-        else:
-            # Завантажуємо слова тільки з вказаного уроку
-            query = {
-                "lesson": lesson_name,
-                "learned": True if show_learned else False
-            }
-            
-        cursor = words_collection.find(query)
-        
-        for word in cursor:
-            words[word['english']] = {
-                "translation": word['ukrainian'],
-                "learned": word.get('learned', False),
-                "lesson": word.get('lesson', 'Головний')
-            }
-                
+        # Ключ — _id: однакові англійські слова з різних уроків не перезаписують одне одного
+        words = {record.id: record for record in iter_words(lesson_name, learned)}
+        _word_cache.put(lesson_name, learned, words)
         return words
     except Exception as e:
-        print(f"Помилка при завантаженні слів: {e}")
+        _fail("Помилка при завантаженні слів", e)
         return {}
 
+DEFAULT_PAGE_SIZE = 100
+
+@metrics.timed("load_words_page", docs=len)
+def load_words_page(lesson_name=None, show_learned=False, after=None, page_size=DEFAULT_PAGE_SIZE):
+    """Одна сторінка слів у порядку (english_key, english, _id).
+
+    after — останній запис попередньої сторінки: наступна сторінка починається
+    одразу після нього (keyset-пагінація), тож кожна сторінка — це короткий
+    прохід по індексу незалежно від розміру словника.
+    """
+    query = {"learned": bool(show_learned)}
+    sort = [('english_key', 1), ('english', 1)]
+    all_lessons = lesson_name is None or lesson_name == "Всі уроки"
+    if all_lessons:
+        # Однакові слова з різних уроків розрізняє _id
+        sort.append(('_id', 1))
+    if after is not None:
+        key = english_key(after.english)
+        query["english_key"] = {'$gte': key}
+        # Слова з тим самим ключем, що йдуть не пізніше за after, вже були
+        if all_lessons:
+            query["$nor"] = [
+                {'english_key': key, 'english': {'$lt': after.english}},
+                {'english_key': key, 'english': after.english, '_id': {'$lte': after.id}},
+            ]
+        else:
+            query["$nor"] = [{'english_key': key, 'english': {'$lte': after.english}}]
+    try:
+        _match_lesson(query, lesson_name)
+        names = lesson_names_by_id()
+        cursor = words_collection().find(query, WORD_PROJECTION).sort(sort).limit(page_size)
+        return [_record(word, names) for word in cursor]
+    except Exception as e:
+        _fail("Помилка при завантаженні сторінки слів", e)
+        return []
+
+@metrics.timed("search_words", docs=len)
+def search_words(query, limit=ngram_index.DEFAULT_LIMIT, lesson_name=None, learned=None):
+    """Шукає слова за фрагментом або з помилками; найкращі збіги першими.
+
+    Повертає список записів WordRecord. Індекс будується з бази при першому виклику.
+    """
+    if lesson_name == "Всі уроки":
+        lesson_name = None
+    try:
+        if not _ngram_index.loaded:
+            _ngram_index.load(iter_words(learned=None))
+
+        def accept(record):
+            return (lesson_name is None or record.lesson == lesson_name) and \
+                (learned is None or record.learned == learned)
+
+        return _ngram_index.search(query, limit=limit, accept=accept)
+    except Exception as e:
+        _fail("Помилка при пошуку слів", e)
+        return []
+
+# Поля, потрібні для тренування: слово і стан його розкладу повторення
+TRAINING_PROJECTION = {
+    '_id': 1, 'english': 1, 'ukrainian': 1, 'lesson_id': 1,
+    'due': 1, 'ease': 1, 'interval': 1, 'reps': 1
+}
+
+@metrics.timed("get_due_words", docs=len)
+def get_due_words(lesson_name=None, limit=scheduler.SESSION_SIZE, now=None):
+    """Повертає до limit невивчених слів: спочатку прострочені повторення, потім нові слова.
+
+    Два запити по індексу (lesson_id, learned, due): слова з due <= now від
+    найбільш прострочених і, якщо місце в сесії залишилось, нові слова без due.
+    Так нові слова не витісняють повторення, заради яких існує розклад.
+    """
+    now = now or datetime.now()
+    try:
+        names = lesson_names_by_id()
+        due_query = _match_lesson({"learned": False, "due": {"$lte": now}}, lesson_name)
+        words = list(words_collection().find(due_query, TRAINING_PROJECTION).sort('due', 1).limit(limit))
+        if len(words) < limit:
+            new_query = _match_lesson({"learned": False, "due": None}, lesson_name)
+            words += list(words_collection().find(new_query, TRAINING_PROJECTION).limit(limit - len(words)))
+        for word in words:
+            word['lesson'] = names.get(word.pop('lesson_id', None), DEFAULT_LESSON)
+        return words
+    except Exception as e:
+        _fail("Помилка при завантаженні слів для повторення", e)
+        return []
+
+@metrics.timed("sample_words", docs=len)
+def sample_words(lesson_name=None, size=scheduler.QUICK_SESSION_SIZE, use_sample=True):
+    """Повертає до size випадкових невивчених слів для швидкої сесії.
+
+    Вибірку робить сервер через $sample, тож передаються лише size документів
+    незалежно від розміру уроку. Якщо $sample недоступний, слова вибираються
+    за індексованим випадковим ключем rand.
+    """
+    from pymongo.errors import OperationFailure
+
+    try:
+        query = _match_lesson({"learned": False}, lesson_name)
+        if use_sample:
+            try:
+                words = list(words_collection().aggregate([
+                    {'$match': query},
+                    {'$sample': {'size': size}},
+                    {'$project': TRAINING_PROJECTION},
+                ]))
+            except OperationFailure as e:
+                logger.warning("$sample недоступний, вибірка за випадковим ключем: %s", e)
+                words = _sample_by_random_key(query, size)
+        else:
+            words = _sample_by_random_key(query, size)
+        names = lesson_names_by_id()
+        for word in words:
+            word['lesson'] = names.get(word.pop('lesson_id', None), DEFAULT_LESSON)
+        return words
+    except Exception as e:
+        _fail("Помилка при виборі випадкових слів", e)
+        return []
+
+def _sample_by_random_key(query, size):
+    """Слова, що йдуть за індексом rand після випадкової точки, з переходом на початок."""
+    start = random_key()
+    words = list(words_collection().find(
+        dict(query, rand={'$gte': start}), TRAINING_PROJECTION
+    ).sort('rand', 1).limit(size))
+    if len(words) < size:
+        words += words_collection().find(
+            dict(query, rand={'$lt': start}), TRAINING_PROJECTION
+        ).sort('rand', 1).limit(size - len(words))
+    random.shuffle(words)
+    return words
+
+@metrics.timed("has_unlearned_words")
+def has_unlearned_words(lesson_name):
+    """Перевіряє, чи є в уроці невивчені слова."""
+    try:
+        query = _match_lesson({"learned": False}, lesson_name)
+        return words_collection().find_one(query, {'_id': 1}) is not None
+    except Exception as e:
+        _fail("Помилка при перевірці слів уроку", e)
+        return False
+
+@metrics.timed("update_schedule", docs=int)
+def update_schedule(word_id, schedule):
+    """Зберігає новий стан розкладу повторення слова."""
+    try:
+        if not drain_journal():
+            return _journal_append({'op': 'set', '_id': word_id, 'fields': schedule}, "розклад слова")
+        result = words_collection().update_one(
+            {'_id': word_id},
+            {'$set': schedule}
+        )
+        return result.matched_count > 0
+    except Exception as e:
+        if _is_offline(e):
+            return _journal_append({'op': 'set', '_id': word_id, 'fields': schedule}, "розклад слова")
+        _fail("Помилка при оновленні розкладу слова", e)
+        return False
+
+@metrics.timed("save_review_logs", docs=int)
+def save_review_logs(entries):
+    """Записує пачку відповідей у журнал одним insert_many."""
+    try:
+        if not entries:
+            return 0
+        result = review_log_collection().insert_many(entries, ordered=False)
+        return len(result.inserted_ids)
+    except Exception as e:
+        _fail("Помилка при збереженні журналу відповідей", e)
+        return 0
+
+@metrics.timed("save_word", docs=bool)
 def save_word(english, ukrainian, lesson_name):
+    """Додає слово в урок і повертає його як WordRecord або False."""
     try:
-        print(f"Спроба зберегти слово: {english} - {ukrainian} в урок {lesson_name}")
-        existing_word = words_collection.find_one({
+        logger.debug("Спроба зберегти слово: %s - %s в урок %s", english, ukrainian, lesson_name)
+        if not drain_journal():
+            return _save_word_offline(english, ukrainian, lesson_name)
+        lesson_id_ = ensure_lesson_id(lesson_name)
+        existing_word = words_collection().find_one({
             'english': english,
-            'lesson': lesson_name
+            'lesson_id': lesson_id_
         })
         if existing_word:
-            print(f"Слово {english} вже існує в уроці {lesson_name}")
+            logger.info("Слово %s вже існує в уроці %s", english, lesson_name)
             return False
-        result = words_collection.insert_one({
+        word = {
             'english': english,
+            'english_key': english_key(english),
             'ukrainian': ukrainian,
+            'rand': random_key(),
             'learned': False,
-            'lesson': lesson_name
-        })
-        print(f"Результат збереження слова: {result.acknowledged}")
-        return result.acknowledged
+            'lesson_id': lesson_id_
+        }
+        result = words_collection().insert_one(word)
+        # insert_one додає до документа створений _id
+        record = WordRecord.from_document(word, lesson=lesson_name)
+        _add_to_caches(record)
+        logger.debug("Результат збереження слова: %s", result.acknowledged)
+        return record if result.acknowledged else False
     except Exception as e:
-        print(f"Помилка при збереженні слова: {e}")
-        import traceback
-        traceback.print_exc()
+        if _is_offline(e):
+            return _save_word_offline(english, ukrainian, lesson_name)
+        _fail("Помилка при збереженні слова", e, exc_info=True)
         return False
 
+@metrics.timed("create_lesson", docs=int)
 def create_lesson(lesson_name, description=""):
     try:
-        print(f"Спроба створити урок: {lesson_name}")
-        if not lessons_collection.find_one({"name": lesson_name}):
-            result = lessons_collection.insert_one({
+        logger.debug("Спроба створити урок: %s", lesson_name)
+        if not lessons_collection().find_one({"name": lesson_name}):
+            result = lessons_collection().insert_one({
                 "name": lesson_name,
                 "description": description,
                 "created_at": datetime.now()
             })
-            print(f"Результат створення уроку: {result.acknowledged}")
+            invalidate_lessons()
+            logger.debug("Результат створення уроку: %s", result.acknowledged)
             return result.acknowledged
         else:
-            print(f"Урок з назвою {lesson_name} вже існує")
+            logger.info("Урок з назвою %s вже існує", lesson_name)
         return False
     except Exception as e:
-        print(f"Помилка при створенні уроку: {e}")
-        import traceback
-        traceback.print_exc()
+        _fail("Помилка при створенні уроку", e, exc_info=True)
         return False
 
+@metrics.timed("rename_lesson", docs=int)
 def rename_lesson(old_name, new_name):
     try:
         if old_name == new_name:
             return True
-        if not lessons_collection.find_one({"name": new_name}):
-            lessons_collection.update_one(
+        if not lessons_collection().find_one({"name": new_name}):
+            # Слова посилаються на урок через lesson_id, тож змінюється лише документ уроку
+            result = lessons_collection().update_one(
                 {"name": old_name},
                 {"$set": {"name": new_name}}
             )
-            words_collection.update_many(
-                {"lesson": old_name},
-                {"$set": {"lesson": new_name}}
-            )
-            return True
+            invalidate_lessons()
+            # Записи в кешах містять стару назву уроку
+            invalidate_words()
+            return result.matched_count > 0
         return False
     except Exception as e:
-        print(f"Помилка при перейменуванні уроку: {e}")
+        _fail("Помилка при перейменуванні уроку", e)
         return False
 
-def toggle_word_learned(english):
-    """Змінює статус вивчення слова."""
+@metrics.timed("toggle_word_learned", docs=bool)
+def toggle_word_learned(word_id, record=None):
+    """Змінює статус вивчення слова і повертає оновлене слово як WordRecord або False.
+
+    record — відома програмі версія слова; потрібна, якщо база недоступна.
+    """
     try:
+        if not drain_journal():
+            return _toggle_learned_offline(word_id, record)
         # Знаходимо слово
-        word = words_collection.find_one({'english': english})
+        word = words_collection().find_one({'_id': word_id})
         if word:
             # Отримуємо поточний статус
             current_status = word.get('learned', False)
             # Змінюємо статус на протилежний
-            result = words_collection.update_one(
-                {'english': english},
+            result = words_collection().update_one(
+                {'_id': word_id},
                 {'$set': {'learned': not current_status}}
             )
             # Перевіряємо, чи оновлення було успішним
-            return result.modified_count > 0
+            if result.modified_count > 0:
+                record = _record(word, lesson_names_by_id()).replace(learned=not current_status)
+                _remove_from_caches(word_id)
+                _add_to_caches(record)
+                return record
         return False
     except Exception as e:
-        print(f"Помилка при зміні статусу слова: {e}")
+        if _is_offline(e):
+            return _toggle_learned_offline(word_id, record)
+        _fail("Помилка при зміні статусу слова", e)
         return False
 
-def save_words(words_dict):
-    """Зберігає словник слів у базу даних."""
+@metrics.timed("delete_word", docs=int)
+def delete_word(word_id):
+    """Видаляє одне слово."""
     try:
-        # Очищаємо колекцію слів
-        words_collection.delete_many({})
-        
-        # Додаємо нові слова
-        for en_word, details in words_dict.items():
-            words_collection.insert_one({
-                'english': en_word,
-                'ukrainian': details['translation'],
-                'learned': details.get('learned', False),
-                'lesson': details.get('lesson', 'Головний')
-            })
-        return True
+        if not drain_journal():
+            return _delete_words_offline([word_id]) > 0
+        result = words_collection().delete_one({'_id': word_id})
+        _remove_from_caches(word_id)
+        return result.deleted_count > 0
     except Exception as e:
-        print(f"Помилка при збереженні слів: {e}")
-        return False 
+        if _is_offline(e):
+            return _delete_words_offline([word_id]) > 0
+        _fail("Помилка при видаленні слова", e)
+        return False
 
-def update_word(old_english, new_english, new_ukrainian, lesson_name):
-    """Оновлює існуюче слово в базі даних."""
+@metrics.timed("delete_words", docs=int)
+def delete_words(word_ids):
+    """Видаляє кілька слів одним запитом. Приймає список _id."""
     try:
+        word_ids = list(word_ids)
+        if not word_ids:
+            return 0
+        if not drain_journal():
+            return _delete_words_offline(word_ids)
+        result = words_collection().delete_many({'_id': {'$in': word_ids}})
+        for word_id in word_ids:
+            _remove_from_caches(word_id)
+        return result.deleted_count
+    except Exception as e:
+        if _is_offline(e):
+            return _delete_words_offline(word_ids)
+        _fail("Помилка при видаленні слів", e)
+        return 0
+
+@metrics.timed("update_word", docs=bool)
+def update_word(word_id, new_english, new_ukrainian, lesson_name, record=None):
+    """Оновлює існуюче слово і повертає його нову версію як WordRecord або False.
+
+    record — відома програмі версія слова; потрібна, якщо база недоступна.
+    """
+    try:
+        if not drain_journal():
+            return _update_word_offline(word_id, new_english, new_ukrainian, lesson_name, record)
         # Знаходимо слово
-        word = words_collection.find_one({'english': old_english})
+        word = words_collection().find_one({'_id': word_id})
         if word:
             # Зберігаємо поточний статус вивчення
             current_learned_status = word.get('learned', False)
             
-            # Якщо змінилося англійське слово, перевіряємо, чи нове слово вже існує
-            if old_english != new_english:
-                existing_word = words_collection.find_one({
+            # Якщо змінилося англійське слово або урок, перевіряємо, чи нове слово вже існує
+            lesson_id_ = ensure_lesson_id(lesson_name)
+            if word['english'] != new_english or word.get('lesson_id') != lesson_id_:
+                existing_word = words_collection().find_one({
                     'english': new_english,
-                    'lesson': lesson_name
+                    'lesson_id': lesson_id_
                 })
                 if existing_word:
                     return False  # Слово з такою назвою вже існує
             
             # Оновлюємо слово
-            result = words_collection.update_one(
-                {'english': old_english},
+            result = words_collection().update_one(
+                {'_id': word_id},
                 {'$set': {
                     'english': new_english,
+                    'english_key': english_key(new_english),
                     'ukrainian': new_ukrainian,
-                    'lesson': lesson_name,
+                    'lesson_id': lesson_id_,
                     'learned': current_learned_status
                 }}
             )
-            
             # Перевіряємо, чи оновлення було успішним
-            return result.modified_count > 0
+            if result.modified_count > 0:
+                record = WordRecord(new_english, new_ukrainian, current_learned_status, lesson_name, word_id)
+                _remove_from_caches(word_id)
+                _add_to_caches(record)
+                return record
         return False
     except Exception as e:
-        print(f"Помилка при оновленні слова: {e}")
-        return False
\ No newline at end of file
+        if _is_offline(e):
+            return _update_word_offline(word_id, new_english, new_ukrainian, lesson_name, record)
+        _fail("Помилка при оновленні слова", e)
+        return False
+
+# Зміни без підключення до бази: save_word, toggle_word_learned, update_word,
+# update_schedule, delete_word і delete_words записують їх у локальний журнал (write_journal.py), а replay_journal()
+# переносить у базу, щойно сервер знову доступний.
+
+_journal = None
+_journal_lock = threading.Lock()
+
+def _write_journal():
+    """Журнал з налаштувань поточного підключення."""
+    global _journal
+    path = get_connection().journal_path
+    with _journal_lock:
+        if _journal is None or _journal.path != path:
+            _journal = WriteJournal(path)
+        return _journal
+
+def journal_pending():
+    """Кількість змін, що чекають запису в базу."""
+    return len(_write_journal())
+
+def _is_offline(error):
+    """Чи означає помилка, що сервер бази недоступний."""
+    from pymongo.errors import ConnectionFailure
+
+    return isinstance(error, ConnectionFailure)
+
+def drain_journal():
+    """Переносить у базу журнал, якщо в ньому щось є; True, якщо журнал порожній.
+
+    Викликається перед кожним записом, щоб зміни не переставились місцями;
+    False означає, що база досі недоступна і новий запис теж треба класти
+    в журнал. Читає файл журналу, тож виконується у фоновому потоці.
+    """
+    return not journal_pending() or replay_journal()
+
+def _journal_append(entry, what):
+    """Кладе зміну в журнал; what — що змінено, для повідомлення в лог."""
+    journal = _write_journal()
+    journal.append(entry)
+    logger.warning("База недоступна: %s збережено в журнал (у черзі %d)", what, len(journal))
+    return True
+
+def _journal_change(entry, record):
+    """Кладе зміну слова в журнал і відразу показує його нову версію в кешах."""
+    _journal_append(entry, f"зміну слова {record.english}")
+    _remove_from_caches(record.id)
+    _add_to_caches(record)
+    return record
+
+def _delete_words_offline(word_ids):
+    _journal_append({'op': 'delete', 'ids': word_ids}, f"видалення {len(word_ids)} слів")
+    for word_id in word_ids:
+        _remove_from_caches(word_id)
+    return len(word_ids)
+
+def _save_word_offline(english, ukrainian, lesson_name):
+    # _id створюється тут: за ним повторне застосування журналу не додасть слово вдруге
+    from bson import ObjectId
+
+    lesson_id_ = _cached_lesson_id(lesson_name)
+    if lesson_id_ is None:
+        logger.error("База недоступна, а урок %s ще не завантажено: слово %s не збережено",
+                     lesson_name, english)
+        return False
+    word = {
+        '_id': ObjectId(),
+        'english': english,
+        'english_key': english_key(english),
+        'ukrainian': ukrainian,
+        'rand': random_key(),
+        'learned': False,
+        'lesson_id': lesson_id_
+    }
+    return _journal_change({'op': 'insert', 'doc': word}, WordRecord.from_document(word, lesson=lesson_name))
+
+def _toggle_learned_offline(word_id, record):
+    record = record or _word_cache.get_word(word_id)
+    if record is None:
+        logger.error("База недоступна, а слова %s немає в кеші: статус не змінено", word_id)
+        return False
+    # У журнал іде новий статус, а не перемикання: так його можна застосувати повторно
+    learned = not record.learned
+    return _journal_change({'op': 'set', '_id': word_id, 'fields': {'learned': learned}},
+                           record.replace(learned=learned))
+
+def _update_word_offline(word_id, new_english, new_ukrainian, lesson_name, record):
+    record = record or _word_cache.get_word(word_id)
+    lesson_id_ = _cached_lesson_id(lesson_name)
+    if record is None or lesson_id_ is None:
+        logger.error("База недоступна, а слова %s або уроку %s немає в кеші: слово не оновлено",
+                     word_id, lesson_name)
+        return False
+    fields = {
+        'english': new_english,
+        'english_key': english_key(new_english),
+        'ukrainian': new_ukrainian,
+        'lesson_id': lesson_id_
+    }
+    return _journal_change({'op': 'set', '_id': word_id, 'fields': fields},
+                           WordRecord(new_english, new_ukrainian, record.learned, lesson_name, word_id))
+
+def _journal_request(entry):
+    """Операція bulk_write для зміни з журналу; повторне виконання нічого не змінює."""
+    from pymongo import DeleteMany, UpdateOne
+
+    if entry['op'] == 'delete':
+        return DeleteMany({'_id': {'$in': entry['ids']}})
+    if entry['op'] == 'insert':
+        doc = dict(entry['doc'])
+        word_id = doc.pop('_id')
+        return UpdateOne({'_id': word_id}, {'$setOnInsert': doc}, upsert=True)
+    return UpdateOne({'_id': entry['_id']}, {'$set': entry['fields']})
+
+@metrics.timed("replay_journal", docs=bool)
+def replay_journal(batch_size=DEFAULT_BATCH_SIZE):
+    """Записує в базу зміни з журналу; True, якщо журнал тепер порожній.
+
+    Зміни йдуть пачками через впорядкований bulk_write, тож пізніша зміна
+    слова перекриває ранішу. Записана пачка прибирається з журналу; якщо
+    зв'язок обірвався посеред пачки, її буде повторено цілком, і це безпечно.
+    Зміну, яку сервер відхилив (наприклад, таке слово в уроці вже є),
+    пропускаємо, щоб вона не затримувала решту.
+    """
+    from pymongo.errors import BulkWriteError
+
+    journal = _write_journal()
+    try:
+        entries = journal.entries()
+        replayed = 0
+        while entries:
+            batch = entries[:batch_size]
+            try:
+                words_collection().bulk_write([_journal_request(entry) for entry in batch], ordered=True)
+                done = len(batch)
+            except BulkWriteError as e:
+                # Впорядкований bulk_write зупиняється на першій помилці
+                error = e.details['writeErrors'][0]
+                done = error['index'] + 1
+                logger.error("Зміну з журналу відхилено (%s): %s", error.get('errmsg'), batch[error['index']])
+                # У кешах лишилась версія слова, якої немає в базі
+                invalidate_words()
+            journal.discard(done)
+            replayed += done
+            entries = entries[done:]
+        if replayed:
+            logger.info("Із журналу в базу перенесено %d змін", replayed)
+        return True
+    except Exception as e:
+        if _is_offline(e):
+            logger.info("База досі недоступна, у журналі %d змін", len(journal))
+        else:
+            _fail("Помилка при записі журналу в базу", e)
+        return False
@@ -0,0 +1,48 @@
+"""
+Виконання запитів до бази даних у фоновому потоці.
+
+Tk не можна викликати з інших потоків, тому результат кожного запиту
+повертається в головний цикл через root.after.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class DbExecutor:
+    """Черга запитів до бази даних з поверненням результатів у потік Tk."""
+
+    def __init__(self, root, max_workers=1, poll_interval_ms=15):
+        # Один робочий потік зберігає порядок запитів: запис завжди
+        # виконується раніше за читання, надіслане після нього
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db")
+
+    def submit(self, fn, *args, on_done=None, on_error=None, **kwargs):
+        """Ставить fn(*args, **kwargs) у чергу і повертає Future.
+
+        on_done(result) або on_error(exception) викликаються в потоці Tk.
+        """
+        future = self._pool.submit(fn, *args, **kwargs)
+        if on_done is not None or on_error is not None:
+            self.root.after(self.poll_interval_ms, self._poll, future, on_done, on_error)
+        return future
+
+    def _poll(self, future, on_done, on_error):
+        if not future.done():
+            self.root.after(self.poll_interval_ms, self._poll, future, on_done, on_error)
+            return
+        error = future.exception()
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+            else:
+                logger.error("Помилка фонового запиту: %s", error, exc_info=error)
+        elif on_done is not None:
+            on_done(future.result())
+
+    def shutdown(self, wait=False):
+        """Зупиняє робочий потік; з wait=True спершу виконує всі запити з черги."""
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
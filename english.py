@@ -1,4 +1,7 @@
+import logging
+
 from ui import run_ui
 
 if __name__ == "__main__":
-    run_ui() 
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    run_ui()
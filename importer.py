@@ -0,0 +1,247 @@
+"""
+Масовий імпорт слів з файлів CSV/TSV/JSONL.
+
+Запуск:  python importer.py words.csv [--lesson Урок] [--batch-size 1000]
+Файл читається потоково, слова записуються пачками через insert_many(ordered=False),
+тому пам'ять не залежить від розміру файлу.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+
+from pymongo.errors import BulkWriteError
+
+import db
+from word_record import english_key
+
+DEFAULT_LESSON = "Головний"
+DEFAULT_BATCH_SIZE = 1000
+DUPLICATE_KEY_ERROR = 11000
+
+
+class ImportReport:
+    """Підсумок імпорту."""
+
+    def __init__(self):
+        self.inserted = 0
+        self.duplicates = {}  # урок -> кількість дублікатів
+        self.invalid = 0
+        self.created_lessons = []
+
+    @property
+    def duplicate_count(self):
+        return sum(self.duplicates.values())
+
+    def add_duplicate(self, lesson):
+        self.duplicates[lesson] = self.duplicates.get(lesson, 0) + 1
+
+
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".tsv":
+        return "tsv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return "csv"
+
+
+def read_rows(path, file_format, default_lesson=DEFAULT_LESSON):
+    """Потоково читає файл і повертає пари (номер рядка, словник з полями слова)."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if file_format == "jsonl":
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    yield line_no, None
+                    continue
+                if not isinstance(row, dict):
+                    yield line_no, None
+                    continue
+                yield line_no, {
+                    "english": row.get("english"),
+                    "ukrainian": row.get("ukrainian"),
+                    "lesson": row.get("lesson") or default_lesson,
+                }
+            return
+
+        reader = csv.reader(f, delimiter="\t" if file_format == "tsv" else ",")
+        columns = ["english", "ukrainian", "lesson"]
+        for line_no, row in enumerate(reader, 1):
+            if not row:
+                continue
+            if line_no == 1 and "english" in [cell.strip().lower() for cell in row]:
+                # Рядок заголовка визначає порядок колонок
+                columns = [cell.strip().lower() for cell in row]
+                continue
+            values = dict(zip(columns, row))
+            yield line_no, {
+                "english": values.get("english"),
+                "ukrainian": values.get("ukrainian"),
+                "lesson": values.get("lesson") or default_lesson,
+            }
+
+
+def validate_row(row):
+    """Повертає документ слова або None, якщо рядок некоректний."""
+    if row is None:
+        return None
+    english = (row.get("english") or "").strip()
+    ukrainian = (row.get("ukrainian") or "").strip()
+    lesson = (row.get("lesson") or "").strip()
+    if not english or not ukrainian or not lesson:
+        return None
+    return {
+        "english": english,
+        "english_key": english_key(english),
+        "ukrainian": ukrainian,
+        "learned": False,
+        "lesson": lesson,
+        "rand": db.random_key(),
+    }
+
+
+def ensure_lessons(lesson_names, known_lessons, report):
+    """Створює уроки, яких ще немає в базі."""
+    for name in lesson_names:
+        if name in known_lessons:
+            continue
+        if db.create_lesson(name):
+            report.created_lessons.append(name)
+        known_lessons.add(name)
+
+
+def stored_document(doc):
+    """Документ для бази: урок зберігається як lesson_id, а не назва."""
+    stored = {key: value for key, value in doc.items() if key != "lesson"}
+    stored["lesson_id"] = db.lesson_id(doc["lesson"])
+    return stored
+
+
+def write_batch(batch, report, on_duplicate=None):
+    """Записує пачку слів, пропускаючи ті, що вже є в уроці. Уроки вже мають існувати."""
+    # Дублікати всередині пачки
+    unique = {}
+    for doc in batch:
+        key = (doc["lesson"], doc["english"])
+        if key in unique:
+            report.add_duplicate(doc["lesson"])
+            if on_duplicate:
+                on_duplicate(*key)
+        else:
+            unique[key] = doc
+
+    # Дублікати, що вже є в базі (включно з попередніми пачками)
+    names = db.lesson_names_by_id()
+    existing = db.words_collection().find(
+        {"$or": [{"lesson_id": db.lesson_id(lesson), "english": english} for lesson, english in unique]},
+        {"_id": 0, "lesson_id": 1, "english": 1}
+    )
+    for word in existing:
+        key = (names.get(word["lesson_id"]), word["english"])
+        if unique.pop(key, None) is not None:
+            report.add_duplicate(key[0])
+            if on_duplicate:
+                on_duplicate(*key)
+
+    if not unique:
+        return
+    docs = list(unique.values())
+    try:
+        result = db.words_collection().insert_many([stored_document(doc) for doc in docs], ordered=False)
+        report.inserted += len(result.inserted_ids)
+    except BulkWriteError as e:
+        details = e.details
+        report.inserted += details.get("nInserted", 0)
+        for error in details.get("writeErrors", []):
+            if error.get("code") != DUPLICATE_KEY_ERROR:
+                raise
+            doc = docs[error["index"]]
+            report.add_duplicate(doc["lesson"])
+            if on_duplicate:
+                on_duplicate(doc["lesson"], doc["english"])
+
+
+def import_file(path, file_format=None, default_lesson=DEFAULT_LESSON,
+                batch_size=DEFAULT_BATCH_SIZE, on_duplicate=None, on_invalid=None):
+    """Імпортує слова з файлу і повертає ImportReport.
+
+    Перед записом мігрує старі документи на lesson_id і створює індекси, як під
+    час запуску застосунку: пошук дублікатів спирається на lesson_id і на
+    унікальний індекс (lesson_id, english). Якщо індекс створити не вдалося,
+    кидає RuntimeError і нічого не імпортує.
+    """
+    file_format = file_format or detect_format(path)
+    if not db.ensure_indexes():
+        raise RuntimeError("Не вдалося підготувати базу до імпорту (див. повідомлення про індекси)")
+    report = ImportReport()
+    known_lessons = set(db.get_lesson_names())
+
+    rows = read_rows(path, file_format, default_lesson)
+    while True:
+        chunk = list(itertools.islice(rows, batch_size))
+        if not chunk:
+            break
+        batch = []
+        for line_no, row in chunk:
+            doc = validate_row(row)
+            if doc is None:
+                report.invalid += 1
+                if on_invalid:
+                    on_invalid(line_no)
+                continue
+            batch.append(doc)
+        if not batch:
+            continue
+        ensure_lessons({doc["lesson"] for doc in batch}, known_lessons, report)
+        write_batch(batch, report, on_duplicate)
+    # Слова записано в обхід функцій db.py, тому кеш слів застарів
+    db.invalidate_words()
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Масовий імпорт слів з CSV/TSV/JSONL.")
+    parser.add_argument("path", help="шлях до файлу")
+    parser.add_argument("--format", choices=["csv", "tsv", "jsonl"], default=None,
+                        help="формат файлу (за замовчуванням визначається за розширенням)")
+    parser.add_argument("--lesson", default=DEFAULT_LESSON,
+                        help="урок для рядків без колонки lesson")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="кількість слів в одному insert_many")
+    args = parser.parse_args(argv)
+
+    if args.batch_size < 1:
+        parser.error("--batch-size має бути більше 0")
+
+    try:
+        report = import_file(
+            args.path,
+            file_format=args.format,
+            default_lesson=args.lesson,
+            batch_size=args.batch_size,
+            on_duplicate=lambda lesson, english: print(f"Дублікат: {english} (урок {lesson})"),
+            on_invalid=lambda line_no: print(f"Некоректний рядок {line_no}", file=sys.stderr),
+        )
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print(f"Додано слів: {report.inserted}")
+    print(f"Дублікатів: {report.duplicate_count}")
+    for lesson, count in sorted(report.duplicates.items()):
+        print(f"  {lesson}: {count}")
+    print(f"Некоректних рядків: {report.invalid}")
+    if report.created_lessons:
+        print(f"Створено уроки: {', '.join(report.created_lessons)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
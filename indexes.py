@@ -0,0 +1,146 @@
+"""
+Індекси колекцій та перевірка, що основні запити їх використовують.
+
+Запуск:  python indexes.py
+Створює індекси (повторний запуск нічого не змінює) і через explain() перевіряє,
+що жоден запит з QUERY_SHAPES не виконується повним скануванням колекції.
+"""
+import logging
+import sys
+from datetime import datetime
+
+from bson import ObjectId
+from pymongo import ASCENDING
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+WORD_INDEXES = [
+    # Слова посилаються на урок через lesson_id
+    {"keys": [("lesson_id", ASCENDING), ("english", ASCENDING)], "name": "lesson_id_english", "unique": True},
+    # Також обслуговує вибірку слів для повторення, відсортованих за due
+    {"keys": [("lesson_id", ASCENDING), ("learned", ASCENDING), ("due", ASCENDING)], "name": "lesson_id_learned_due"},
+    # Посторінковий перегляд словника уроку і всіх уроків
+    {"keys": [("lesson_id", ASCENDING), ("learned", ASCENDING), ("english_key", ASCENDING), ("english", ASCENDING)],
+     "name": "lesson_id_learned_english_key"},
+    {"keys": [("learned", ASCENDING), ("english_key", ASCENDING), ("english", ASCENDING), ("_id", ASCENDING)],
+     "name": "learned_english_key_id"},
+    # Випадкова вибірка слів для швидкої сесії, коли $sample недоступний
+    {"keys": [("lesson_id", ASCENDING), ("learned", ASCENDING), ("rand", ASCENDING)], "name": "lesson_id_learned_rand"},
+    {"keys": [("learned", ASCENDING), ("rand", ASCENDING)], "name": "learned_rand"},
+]
+
+# Індекси, які замінено іншими і які треба видалити. Індекси за назвою уроку
+# видаляються до міграції на lesson_id: унікальний lesson_english не дав би
+# прибрати поле lesson у слів з однаковим english.
+OBSOLETE_WORD_INDEXES = [
+    "lesson_learned", "lesson_english", "lesson_learned_due", "lesson_learned_english_key",
+    "learned_english_key", "lesson_learned_rand",
+]
+
+LESSON_INDEXES = [
+    {"keys": [("name", ASCENDING)], "name": "name", "unique": True},
+]
+
+# Будь-який _id уроку: для плану запиту важливий лише тип значення
+LESSON_ID = ObjectId("000000000000000000000000")
+# Будь-яка дата для запитів за due
+DUE = datetime(2000, 1, 1)
+
+# Форми запитів, які db.py виконує і які повинні йти по індексу:
+# (колекція, фільтр) або (колекція, фільтр, сортування)
+QUERY_SHAPES = [
+    ("words", {"lesson_id": LESSON_ID, "learned": False}),
+    ("words", {"lesson_id": LESSON_ID, "learned": False, "due": {"$lte": DUE}}, [("due", ASCENDING)]),
+    ("words", {"lesson_id": LESSON_ID, "learned": False, "due": None}),
+    ("words", {"lesson_id": LESSON_ID, "english": "word"}),
+    ("words", {"lesson_id": LESSON_ID, "learned": False, "english_key": {"$gte": "word"}},
+     [("english_key", ASCENDING), ("english", ASCENDING)]),
+    ("words", {"learned": False, "english_key": {"$gte": "word"}},
+     [("english_key", ASCENDING), ("english", ASCENDING), ("_id", ASCENDING)]),
+    ("words", {"lesson_id": LESSON_ID, "learned": False, "rand": {"$gte": 0.5}}, [("rand", ASCENDING)]),
+    ("words", {"learned": False, "rand": {"$gte": 0.5}}, [("rand", ASCENDING)]),
+    ("lessons", {"name": "Головний"}),
+]
+
+
+def _create(collection, specs):
+    """Створює індекси specs; повертає назви тих, які створити не вдалося."""
+    failed = []
+    for spec in specs:
+        options = {key: value for key, value in spec.items() if key != "keys"}
+        try:
+            collection.create_index(spec["keys"], **options)
+        except OperationFailure as e:
+            # Наприклад, у колекції вже є дублікати для унікального індексу
+            logger.error("Не вдалося створити індекс %s: %s", spec["name"], e)
+            failed.append(spec["name"])
+    return failed
+
+
+def drop_obsolete_indexes(words_collection):
+    """Видаляє індекси, замінені іншими."""
+    existing = words_collection.index_information()
+    for name in OBSOLETE_WORD_INDEXES:
+        if name in existing:
+            words_collection.drop_index(name)
+
+
+def ensure_indexes(lessons_collection, words_collection):
+    """Створює всі потрібні індекси; повертає назви тих, які створити не вдалося.
+
+    Безпечно викликати при кожному запуску. Без унікальних індексів не
+    працюють перевірка дублікатів при імпорті і застосування журналу змін.
+    """
+    drop_obsolete_indexes(words_collection)
+    return _create(words_collection, WORD_INDEXES) + _create(lessons_collection, LESSON_INDEXES)
+
+
+def _stages(plan):
+    """Повертає назви всіх етапів плану запиту."""
+    if not isinstance(plan, dict):
+        return
+    if "stage" in plan:
+        yield plan["stage"]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            yield from _stages(plan[key])
+    for child in plan.get("inputStages", []):
+        yield from _stages(child)
+
+
+def find_unindexed_queries(lessons_collection, words_collection, shapes=QUERY_SHAPES):
+    """Повертає форми запитів, для яких explain() показує COLLSCAN або сортування в пам'яті."""
+    collections = {"lessons": lessons_collection, "words": words_collection}
+    unindexed = []
+    for shape in shapes:
+        name, query = shape[0], shape[1]
+        cursor = collections[name].find(query)
+        if len(shape) > 2:
+            cursor = cursor.sort(shape[2])
+        plan = cursor.explain()
+        winning_plan = plan.get("queryPlanner", {}).get("winningPlan", {})
+        if {"COLLSCAN", "SORT"} & set(_stages(winning_plan)):
+            unindexed.append(shape)
+    return unindexed
+
+
+def main():
+    import db
+
+    # Разом із міграцією старих документів, як під час запуску застосунку
+    if not db.ensure_indexes():
+        print("Не всі індекси створено, див. повідомлення вище")
+        return 1
+    unindexed = find_unindexed_queries(db.lessons_collection(), db.words_collection())
+    for shape in unindexed:
+        sort = f".sort({shape[2]})" if len(shape) > 2 else ""
+        print(f"Без індексу: {shape[0]}.find({shape[1]}){sort}")
+    if unindexed:
+        return 1
+    print("Усі запити використовують індекси")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Комбобокс уроків з кількістю слів.
+
+Біля назви кожного уроку показується, скільки в ньому вивчених і всього слів
+(дані з db.get_lesson_stats). Решта коду працює лише з назвами уроків:
+get_lesson() повертає назву вибраного уроку, а не підпис.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+ALL_LESSONS = "Всі уроки"
+
+
+def lesson_label(name, counts):
+    """Підпис уроку: назва і кількість вивчених слів з усіх."""
+    if counts is None:
+        return name
+    return f"{name} ({counts['learned']}/{counts['total']} вивчено)"
+
+
+class LessonCombobox(ttk.Combobox):
+    """Комбобокс, значення якого — підписи уроків з кількістю слів."""
+
+    def __init__(self, master, include_all=False, lesson=None, **options):
+        self.var = tk.StringVar(value=lesson or "")
+        options.setdefault("state", "readonly")
+        super().__init__(master, textvariable=self.var, **options)
+        self.include_all = include_all
+        self._lessons = []
+        self._stats = None
+        self._names = {}  # підпис -> назва уроку
+
+    def lessons(self):
+        """Назви уроків без пункту "Всі уроки"."""
+        return list(self._lessons)
+
+    def get_lesson(self):
+        """Назва вибраного уроку."""
+        return self._names.get(self.var.get(), self.var.get())
+
+    def set_lesson(self, name):
+        self.var.set(self._label(name))
+
+    def set_lessons(self, lessons, stats=None, selected=None):
+        """Замінює список уроків; вибраний урок зберігається, якщо не вказано інший."""
+        selected = selected or self.get_lesson()
+        self._lessons = list(lessons)
+        if stats is not None:
+            self._stats = stats
+        self._refresh(selected)
+
+    def set_stats(self, stats):
+        """Оновлює лише кількість слів, наприклад після зміни статусу слова."""
+        self._stats = stats
+        self._refresh(self.get_lesson())
+
+    def apply_change(self, old, new):
+        """Оновлює кількість слів після зміни одного слова.
+
+        old і new — WordRecord до і після зміни; None означає, що слово додано
+        або видалено. Так не потрібно заново рахувати всі слова в базі.
+        """
+        if self._stats is None:
+            return
+        for record, delta in ((old, -1), (new, 1)):
+            if record is None:
+                continue
+            counts = self._stats.setdefault(record.lesson, {"total": 0, "learned": 0})
+            counts["total"] += delta
+            if record.learned:
+                counts["learned"] += delta
+        self._refresh(self.get_lesson())
+
+    def _counts(self, name):
+        if self._stats is None:
+            return None
+        if name == ALL_LESSONS:
+            counts = {"total": 0, "learned": 0}
+            for lesson_counts in self._stats.values():
+                counts["total"] += lesson_counts["total"]
+                counts["learned"] += lesson_counts["learned"]
+            return counts
+        return self._stats.get(name, {"total": 0, "learned": 0})
+
+    def _label(self, name):
+        return lesson_label(name, self._counts(name)) if name in self._names.values() else name
+
+    def _refresh(self, selected):
+        names = ([ALL_LESSONS] if self.include_all else []) + self._lessons
+        self._names = {lesson_label(name, self._counts(name)): name for name in names}
+        self['values'] = list(self._names)
+        if selected:
+            self.set_lesson(selected)
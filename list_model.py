@@ -0,0 +1,106 @@
+"""
+Модель відсортованого списку слів для точкових змін без перезавантаження.
+
+Елементи — записи WordRecord, ті самі, що повертає load_words(). Функції
+запису в db.py повертають змінене слово як новий запис, тому список
+оновлює лише один рядок.
+
+Модель може містити лише початок списку, завантажений сторінками
+(db.load_words_page): поки complete хибне, слова, що йдуть після останнього
+завантаженого, не вставляються — вони прийдуть з наступною сторінкою.
+"""
+from bisect import bisect_left
+
+from word_record import english_key
+
+
+def sort_key(record):
+    # Той самий порядок, що й у db.load_words_page
+    return (english_key(record.english), record.english, record.id)
+
+
+class WordListModel:
+    """Слова, відсортовані за англійським алфавітом, з пошуком позиції через bisect.
+
+    Рядок списку — це позиція в items, тож id слова в рядку береться за O(1);
+    зворотний пошук рядка за id іде через словник записів і bisect.
+    """
+
+    def __init__(self, items=(), accept=None):
+        # accept(record) вирішує, чи належить слово до цього списку (урок, статус)
+        self.reset(items, accept)
+
+    def reset(self, items, accept=None, complete=True):
+        """Замінює всі слова, наприклад після завантаження іншого уроку."""
+        self.accept = accept
+        self.complete = complete
+        self.items = sorted(items, key=sort_key)
+        self._keys = [sort_key(record) for record in self.items]
+        self._records = {record.id: record for record in self.items}
+
+    def extend(self, records, complete):
+        """Додає в кінець наступну сторінку слів, уже відсортовану сервером."""
+        for record in records:
+            if record.id in self._records:
+                continue
+            self._keys.append(sort_key(record))
+            self.items.append(record)
+            self._records[record.id] = record
+        self.complete = complete
+
+    def last(self):
+        """Останнє завантажене слово — курсор для наступної сторінки."""
+        return self.items[-1] if self.items else None
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def accepts(self, record):
+        return self.accept is None or self.accept(record)
+
+    def id_at(self, index):
+        """Id слова в рядку index."""
+        return self.items[index].id
+
+    def index_of(self, word_id):
+        """Позиція слова з цим id або None."""
+        record = self._records.get(word_id)
+        if record is None:
+            return None
+        return bisect_left(self._keys, sort_key(record))
+
+    def insert(self, record):
+        """Вставляє слово у відсортовану позицію і повертає її.
+
+        Слово за межами ще не завантаженої частини не вставляється (None).
+        """
+        key = sort_key(record)
+        if not self.complete and (not self._keys or key > self._keys[-1]):
+            return None
+        index = bisect_left(self._keys, key)
+        self._keys.insert(index, key)
+        self.items.insert(index, record)
+        self._records[record.id] = record
+        return index
+
+    def remove(self, word_id):
+        """Видаляє слово і повертає його колишню позицію або None."""
+        index = self.index_of(word_id)
+        if index is not None:
+            del self._keys[index]
+            del self.items[index]
+            del self._records[word_id]
+        return index
+
+    def update(self, word_id, record):
+        """Замінює слово новою версією.
+
+        Повертає (стара позиція, нова позиція); нова позиція None, якщо слово
+        більше не належить до списку (наприклад, його позначено як вивчене).
+        """
+        old_index = self.remove(word_id)
+        new_index = self.insert(record) if record is not None and self.accepts(record) else None
+        return old_index, new_index
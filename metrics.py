@@ -0,0 +1,143 @@
+"""
+Вимірювання операцій з базою: затримки, помилки, кількість документів.
+
+Функції db.py позначено декоратором @timed("назва"). Для кожної операції
+зберігається кількість викликів і помилок, сума документів і гістограма
+затримок з фіксованими межами кошиків, тож пам'ять не залежить від кількості
+викликів. Помилку, яку функція перехоплює сама, зараховує failed().
+
+Звіт: format_report() (у застосунку — Ctrl+M) або snapshot() для JSON.
+"""
+import threading
+import time
+from functools import wraps
+
+# Верхні межі кошиків гістограми, мс; останній кошик — усе, що довше
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class OperationStats:
+    """Накопичені показники однієї операції."""
+
+    __slots__ = ("calls", "errors", "docs", "total_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.docs = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, elapsed_ms, docs, failed):
+        self.calls += 1
+        self.errors += failed
+        self.docs += docs
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        index = 0
+        while index < len(BUCKETS_MS) and elapsed_ms > BUCKETS_MS[index]:
+            index += 1
+        self.buckets[index] += 1
+
+    def percentile(self, fraction):
+        """Верхня межа кошика, в який потрапляє частка fraction викликів."""
+        threshold = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= threshold:
+                return BUCKETS_MS[index] if index < len(BUCKETS_MS) else self.max_ms
+        return 0.0
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "docs": self.docs,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "buckets": dict(zip([f"<={bound}" for bound in BUCKETS_MS] + ["more"], self.buckets)),
+        }
+
+
+class Metrics:
+    """Реєстр показників операцій; безпечний для виклику з кількох потоків."""
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Стек операцій, що виконуються в потоці
+
+    def record(self, operation, elapsed_ms, docs=0, failed=False):
+        with self._lock:
+            stats = self._stats.get(operation)
+            if stats is None:
+                stats = self._stats[operation] = OperationStats()
+            stats.add(elapsed_ms, docs, failed)
+
+    def timed(self, operation, docs=None):
+        """Декоратор: вимірює виклик; docs(result) повертає кількість документів."""
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                stack = self._local.__dict__.setdefault("stack", [])
+                frame = [False]  # Чи позначено поточний виклик як помилку
+                stack.append(frame)
+                start = time.perf_counter()
+                result = None
+                try:
+                    result = fn(*args, **kwargs)
+                    return result
+                except BaseException:
+                    frame[0] = True
+                    raise
+                finally:
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    stack.pop()
+                    count = 0
+                    if docs is not None and not frame[0]:
+                        try:
+                            count = docs(result)
+                        except TypeError:
+                            count = 0
+                    self.record(operation, elapsed_ms, count, frame[0])
+            return wrapper
+        return decorator
+
+    def failed(self):
+        """Позначає помилкою операцію, що зараз виконується в цьому потоці."""
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            stack[-1][0] = True
+
+    def snapshot(self):
+        """Показники всіх операцій як словник для JSON."""
+        with self._lock:
+            return {operation: stats.as_dict() for operation, stats in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def format_report(self):
+        """Текстова таблиця операцій, від найбільшого сумарного часу."""
+        rows = sorted(self.snapshot().items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        lines = [f"{'операція':<22} {'викл.':>6} {'помил.':>6} {'док.':>8} "
+                 f"{'сума мс':>9} {'сер.':>7} {'p95':>7} {'макс':>7}"]
+        for operation, stats in rows:
+            lines.append(f"{operation:<22} {stats['calls']:>6} {stats['errors']:>6} {stats['docs']:>8} "
+                         f"{stats['total_ms']:>9.1f} {stats['mean_ms']:>7.1f} "
+                         f"{stats['p95_ms']:>7.0f} {stats['max_ms']:>7.1f}")
+        return "\n".join(lines)
+
+
+# Спільний реєстр застосунку
+metrics = Metrics()
+timed = metrics.timed
+failed = metrics.failed
+snapshot = metrics.snapshot
+format_report = metrics.format_report
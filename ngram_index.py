@@ -0,0 +1,135 @@
+"""
+Триграмний індекс для пошуку за фрагментом слова і з помилками.
+
+Англійське слово і переклад розбиваються на триграми (трійки сусідніх
+символів, з пробілами на краях). Для кожної триграми індекс зберігає
+множину слів, у яких вона трапляється, тому кандидатів для запиту дають
+лише списки його триграм, а не перебір усіх слів.
+
+Оцінка збігу:
+  * фрагмент міститься в тексті — від 1 до 2 (коротші тексти вище);
+  * інакше коефіцієнт Дайса для множин триграм, від 0 до 1.
+"""
+import threading
+from collections import Counter
+
+DEFAULT_LIMIT = 20
+MIN_SCORE = 0.3
+
+
+def trigrams(text):
+    """Множина триграм тексту в нижньому регістрі."""
+    text = f"  {text.lower().strip()} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def similarity(query, text, query_grams=None):
+    """Оцінка збігу запиту з текстом (0, якщо збігу немає)."""
+    query = query.lower().strip()
+    text = text.lower()
+    if not query or not text:
+        return 0.0
+    if query in text:
+        return 1.0 + len(query) / len(text)
+    query_grams = query_grams if query_grams is not None else trigrams(query)
+    text_grams = trigrams(text)
+    return 2 * len(query_grams & text_grams) / (len(query_grams) + len(text_grams))
+
+
+def score_word(query, record, query_grams=None):
+    """Найкраща оцінка серед англійського слова і перекладу."""
+    query_grams = query_grams if query_grams is not None else trigrams(query)
+    return max(similarity(query, record.english, query_grams),
+               similarity(query, record.translation, query_grams))
+
+
+class TrigramIndex:
+    """Інвертований індекс слів за триграмами англійського слова і перекладу.
+
+    Поки індекс не заповнено (loaded == False), add і remove нічого не роблять:
+    повний індекс будується з бази при першому пошуку.
+    """
+
+    def __init__(self):
+        self._postings = {}  # триграма -> {_id}
+        self._words = {}     # _id -> (WordRecord, триграми)
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._words)
+
+    def load(self, records):
+        """Заповнює індекс записами WordRecord."""
+        with self._lock:
+            self._postings = {}
+            self._words = {}
+            for record in records:
+                self._add(record)
+            self.loaded = True
+
+    def invalidate(self):
+        """Очищає індекс; наступний пошук збудує його заново."""
+        with self._lock:
+            self._postings = {}
+            self._words = {}
+            self.loaded = False
+
+    def add_word(self, record):
+        with self._lock:
+            if self.loaded:
+                self._remove(record.id)
+                self._add(record)
+
+    def remove_word(self, word_id):
+        with self._lock:
+            if self.loaded:
+                self._remove(word_id)
+
+    def search(self, query, limit=DEFAULT_LIMIT, min_score=MIN_SCORE, accept=None):
+        """Повертає до limit записів WordRecord, найкращі збіги першими.
+
+        accept(record) відкидає слова, які не потрібні (наприклад, з іншого уроку).
+        """
+        query = query.lower().strip()
+        if not query:
+            return []
+        query_grams = trigrams(query)
+        with self._lock:
+            # Скільки триграм запиту має кожне слово
+            shared = Counter()
+            for gram in query_grams:
+                postings = self._postings.get(gram)
+                if postings:
+                    shared.update(postings)
+            # Слово з оцінкою min_score мусить мати хоча б стільки спільних триграм
+            needed = max(1, int(min_score * len(query_grams) / 2))
+            candidates = [self._words[key][0] for key, count in shared.items() if count >= needed]
+
+        ranked = []
+        for record in candidates:
+            if accept is not None and not accept(record):
+                continue
+            score = score_word(query, record, query_grams)
+            if score >= min_score:
+                ranked.append((-score, record.english.lower(), record.lesson, record))
+        ranked.sort(key=lambda entry: entry[:3])
+        return [entry[3] for entry in ranked[:limit]]
+
+    def _add(self, record):
+        key = record.id
+        grams = trigrams(record.english) | trigrams(record.translation)
+        self._words[key] = (record, grams)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def _remove(self, key):
+        entry = self._words.pop(key, None)
+        if entry is None:
+            return
+        for gram in entry[1]:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self._postings[gram]
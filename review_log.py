@@ -0,0 +1,73 @@
+"""
+Буферизований запис журналу відповідей під час тренування.
+
+Кожна відповідь лише додається до списку в пам'яті; у базу записи потрапляють
+пачкою через insert_many, коли буфер заповнився, коли найстаріший запис
+чекає довше за max_age або коли тренування закінчилося. Вік перевіряють
+record() і flush_stale(), яку застосунок викликає за таймером, тож записи не
+залишаються в буфері, коли користувач перестав відповідати.
+"""
+import threading
+import time
+from datetime import datetime
+
+DEFAULT_MAX_ENTRIES = 50
+DEFAULT_MAX_AGE = 30.0  # секунд
+
+
+class ReviewLogWriter:
+    """Буфер записів журналу відповідей."""
+
+    def __init__(self, write_batch, submit=None,
+                 max_entries=DEFAULT_MAX_ENTRIES, max_age=DEFAULT_MAX_AGE):
+        # write_batch(entries) записує пачку; submit(fn, entries) виконує запис
+        # у фоні, без нього запис виконується одразу
+        self.write_batch = write_batch
+        self.submit = submit
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._buffer = []
+        self._first_at = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def record(self, word_id, english, lesson, direction, attempts, latency, timestamp=None):
+        """Додає відповідь до буфера і записує буфер, якщо досягнуто порогу."""
+        entry = {
+            "word_id": word_id,
+            "english": english,
+            "lesson": lesson,
+            "direction": direction,
+            "attempts": attempts,
+            "latency": latency,
+            "timestamp": timestamp or datetime.now(),
+        }
+        with self._lock:
+            self._buffer.append(entry)
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+            full = len(self._buffer) >= self.max_entries
+            stale = time.monotonic() - self._first_at >= self.max_age
+        if full or stale:
+            self.flush()
+
+    def flush_stale(self):
+        """Записує буфер, якщо найстаріший запис чекає довше за max_age."""
+        with self._lock:
+            stale = self._first_at is not None and time.monotonic() - self._first_at >= self.max_age
+        if stale:
+            self.flush()
+
+    def flush(self):
+        """Записує все, що накопичилося в буфері."""
+        with self._lock:
+            entries, self._buffer = self._buffer, []
+            self._first_at = None
+        if not entries:
+            return
+        if self.submit is not None:
+            self.submit(self.write_batch, entries)
+        else:
+            self.write_batch(entries)
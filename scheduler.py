@@ -0,0 +1,51 @@
+"""
+Інтервальне повторення слів за алгоритмом SM-2.
+
+Кожне слово зберігає стан розкладу: due (коли повторити), ease (коефіцієнт
+легкості), interval (інтервал у днях) та reps (кількість успішних повторень
+поспіль). Слова без due ще не тренувалися і вважаються готовими до повторення.
+"""
+from datetime import datetime, timedelta
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+SESSION_SIZE = 20
+QUICK_SESSION_SIZE = 10  # Слів у швидкій сесії з випадковою вибіркою
+
+
+def grade_from_attempts(attempts):
+    """Оцінка відповіді за шкалою SM-2 (0-5) за кількістю помилкових спроб."""
+    if attempts == 0:
+        return 5
+    if attempts == 1:
+        return 3
+    return 1
+
+
+def review(word, grade, now=None):
+    """Обчислює новий стан розкладу слова після відповіді з оцінкою grade."""
+    now = now or datetime.now()
+    ease = word.get("ease") or DEFAULT_EASE
+    interval = word.get("interval") or 0
+    reps = word.get("reps") or 0
+
+    if grade < 3:
+        # Слово забуто: починаємо повторення спочатку
+        reps = 0
+        interval = 1
+    else:
+        reps += 1
+        if reps == 1:
+            interval = 1
+        elif reps == 2:
+            interval = 6
+        else:
+            interval = round(interval * ease)
+
+    ease = max(MIN_EASE, ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+    return {
+        "ease": ease,
+        "interval": interval,
+        "reps": reps,
+        "due": now + timedelta(days=interval),
+    }
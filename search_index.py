@@ -0,0 +1,104 @@
+"""
+Префіксний індекс для пошуку слів під час введення.
+
+Кожне слово індексується за англійським словом і перекладом: за повним
+рядком і за окремими словами в ньому, у нижньому регістрі. Ключі зберігаються
+у відсортованому списку, тому всі ключі з потрібним префіксом лежать поруч і
+знаходяться двома викликами bisect. Елементи — ті самі записи WordRecord,
+що й у WordListModel.
+"""
+import re
+from bisect import bisect_left
+from operator import itemgetter
+
+from list_model import sort_key
+
+# Символ, більший за будь-яку літеру: межа діапазону ключів з префіксом
+_PREFIX_END = "\U0010ffff"
+_SEPARATORS = re.compile(r"[\s,;/()]+")
+
+
+def index_terms(record):
+    """Ключі, за якими слово знаходиться пошуком."""
+    terms = set()
+    for text in (record.english, record.translation):
+        text = text.lower().strip()
+        if text:
+            terms.add(text)
+            terms.update(part for part in _SEPARATORS.split(text) if part)
+    return terms
+
+
+class PrefixIndex:
+    """Пошук слів за початком англійського слова або перекладу."""
+
+    def __init__(self, records=()):
+        self.reset(records)
+
+    def reset(self, records):
+        """Будує індекс заново, наприклад після завантаження іншого уроку."""
+        # Ключі кожного слова потрібні, щоб прибрати їх при зміні слова
+        self._terms = {}  # id -> (ключі, sort_key)
+        entries = []
+        for record in records:
+            order = sort_key(record)
+            terms = index_terms(record)
+            self._terms[record.id] = (terms, order)
+            for term in terms:
+                entries.append(((term, order), record))
+        entries.sort(key=itemgetter(0))
+        # Ключ (term, sort_key); порядок слова зберігається окремо, щоб пошук
+        # сортував уже готові кортежі і не створював нових
+        self._keys = [key for key, _ in entries]
+        self._orders = [key[1] for key, _ in entries]
+        self._items = [item for _, item in entries]
+
+    def __len__(self):
+        return len(self._terms)
+
+    def add(self, record):
+        """Додає слово до індексу."""
+        terms = index_terms(record)
+        order = sort_key(record)
+        self._terms[record.id] = (terms, order)
+        for term in terms:
+            key = (term, order)
+            index = bisect_left(self._keys, key)
+            self._keys.insert(index, key)
+            self._orders.insert(index, order)
+            self._items.insert(index, record)
+
+    def remove(self, word_id):
+        """Прибирає всі ключі слова; повертає False, якщо слова не було."""
+        entry = self._terms.pop(word_id, None)
+        if entry is None:
+            return False
+        terms, order = entry
+        for term in terms:
+            key = (term, order)
+            index = bisect_left(self._keys, key)
+            if index < len(self._keys) and self._keys[index] == key:
+                del self._keys[index]
+                del self._orders[index]
+                del self._items[index]
+        return True
+
+    def update(self, word_id, record):
+        """Замінює слово новою версією; record None лише видаляє слово."""
+        self.remove(word_id)
+        if record is not None:
+            self.add(record)
+
+    def search(self, query):
+        """Слова, в яких англійське слово або переклад починається з query.
+
+        Результат відсортовано так само, як у WordListModel.
+        """
+        query = query.lower().strip()
+        if not query:
+            return []
+        start = bisect_left(self._keys, (query,))
+        end = bisect_left(self._keys, (query + _PREFIX_END,))
+        # Слово може збігтися за кількома ключами; лишаємо одну копію
+        found = dict(zip(self._orders[start:end], self._items[start:end]))
+        return [found[key] for key in sorted(found)]
@@ -1,8 +1,24 @@
+import logging
 import tkinter as tk
 from tkinter import messagebox, ttk, simpledialog
-from db import get_lessons, load_words, save_word, create_lesson, rename_lesson, toggle_word_learned
+from db import get_lesson_names, get_lesson_stats, load_words, load_words_page, DEFAULT_PAGE_SIZE, search_words, get_due_words, sample_words, has_unlearned_words, update_schedule, save_review_logs, save_word, create_lesson, rename_lesson, toggle_word_learned, delete_word as db_delete_word, warm_up, drain_journal
 from datetime import datetime
-import random
+import scheduler
+import time
+from review_log import ReviewLogWriter
+from db_worker import DbExecutor
+from virtual_list import VirtualList
+from list_model import WordListModel
+from search_index import PrefixIndex
+from lesson_combo import LessonCombobox, ALL_LESSONS
+import metrics
+
+SEARCH_DELAY_MS = 150  # Пауза у введенні, після якої запускається пошук
+REVIEW_LOG_CHECK_MS = 5_000  # Як часто перевіряти, чи не застарів буфер журналу відповідей
+JOURNAL_RETRY_MS = 30_000  # Як часто пробувати записати в базу зміни, зроблені без підключення
+
+logger = logging.getLogger(__name__)
+
 
 class WordTrainerApp:
     def __init__(self, root):
@@ -15,12 +31,21 @@ class WordTrainerApp:
         self.training_data = []
         self.training_index = 0
         self.training_mode = "EN-UA"
+        self.quick_session = False  # Швидка сесія з випадкових слів замість повторення за розкладом
         self.mistake_count = 0
         self.current_word = None
         self.correct_answer = ""
         self.score = 0
         self.attempts_count = 0  
+        self.view_id = 0  # Змінюється при кожній зміні екрана
+        self.db_executor = DbExecutor(root)
+        # Відповіді записуються пачками у фоні, а не після кожної відповіді
+        self.review_log = ReviewLogWriter(save_review_logs, submit=self.db_executor.submit)
+        self.question_started = time.monotonic()
+        self.training_widgets = None  # Віджети екрана тренування, поки він відкритий
         self.create_main_menu()
+        self.root.after(REVIEW_LOG_CHECK_MS, self.flush_stale_review_log)
+        self.root.after(JOURNAL_RETRY_MS, self.retry_journal)
 
         # Гарячі клавіші
         self.root.bind("<Control-Key-1>", lambda event: self.add_word_ui())
@@ -28,14 +53,56 @@ class WordTrainerApp:
         self.root.bind("<Control-Key-3>", lambda event: self.select_mode())
         self.root.bind("<Control-Key-4>", lambda event: self.show_learned_words())
         self.root.bind("<Escape>", lambda event: self.create_main_menu())
+        self.root.bind("<Control-Key-m>", lambda event: self.show_metrics())
+
+    def flush_stale_review_log(self):
+        """Записує відповіді, що чекають у буфері довше за max_age, навіть без нових відповідей."""
+        self.review_log.flush_stale()
+        self.root.after(REVIEW_LOG_CHECK_MS, self.flush_stale_review_log)
+
+    def retry_journal(self):
+        """Періодично переносить у базу зміни, збережені в журнал без підключення."""
+        # Перевірка читає файл журналу, тож теж іде у фоновий потік
+        self.db_executor.submit(drain_journal)
+        self.root.after(JOURNAL_RETRY_MS, self.retry_journal)
 
     def clear_window(self):
+        self.view_id += 1
+        self.set_busy(False)
+        self.training_widgets = None
         for widget in self.root.winfo_children():
             widget.destroy()
 
+    def show_metrics(self):
+        """Показує у вікні показники операцій з базою з моменту запуску."""
+        window = tk.Toplevel(self.root)
+        window.title("Показники операцій з базою")
+        window.configure(bg="#f0f8ff")
+        text = tk.Text(window, font=("Consolas", 10), width=90, height=25, bg="white")
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        text.insert(tk.END, metrics.format_report())
+        text.configure(state=tk.DISABLED)
+
+    def run_db(self, fn, *args, on_done=None, on_error=None):
+        """Виконує запит до бази у фоні; колбеки не викликаються, якщо екран вже змінився."""
+        view_id = self.view_id
+
+        def done(result):
+            if self.view_id == view_id and on_done is not None:
+                on_done(result)
+
+        def error(exc):
+            logger.error("UI: Помилка фонового запиту: %s", exc, exc_info=exc)
+            if self.view_id == view_id and on_error is not None:
+                on_error(exc)
+
+        return self.db_executor.submit(fn, *args, on_done=done, on_error=error)
+
     def create_main_menu(self):
         self.clear_window()
         self.root.unbind("<Return>")
+        # Тренування могли перервати: записуємо накопичені відповіді
+        self.review_log.flush()
 
         # Головний контейнер
         main_container = tk.Frame(self.root, bg="#f0f8ff")
@@ -89,6 +156,26 @@ class WordTrainerApp:
         # Конвертуємо назад в HEX
         return f"#{r:02x}{g:02x}{b:02x}"
 
+    def fetch_lessons(self):
+        """Повертає назви уроків, створюючи урок "Головний", якщо їх немає.
+
+        Виконується у фоновому потоці; None означає, що урок створити не вдалося.
+        """
+        lessons = get_lesson_names()
+        if lessons:
+            return lessons
+        logger.info("UI: Список уроків порожній. Створюємо урок 'Головний'")
+        result = create_lesson("Головний")
+        logger.info("UI: Результат створення уроку 'Головний': %s", result)
+        if not result:
+            return None
+        # Якщо все ще немає уроків, використовуємо замінник
+        return get_lesson_names() or ["Головний"]
+
+    def set_busy(self, busy):
+        """Показує курсор очікування, поки триває запит до бази."""
+        self.root.configure(cursor="watch" if busy else "")
+
     def select_mode(self):
         """Вибір режиму тренування."""
         self.clear_window()
@@ -105,31 +192,10 @@ class WordTrainerApp:
         tk.Label(main_container, text="Оберіть урок:", 
                 font=("Arial", 14), bg="#f0f8ff", fg="#34495e").pack(pady=(0, 5))
         
-        # Отримуємо список уроків
-        lessons = [lesson["name"] for lesson in get_lessons()]
-        
-        # Якщо список уроків порожній, створюємо урок "Головний"
-        if not lessons:
-            print("UI: Список уроків порожній у select_mode. Створюємо урок 'Головний'")
-            result = create_lesson("Головний")
-            print(f"UI: Результат створення уроку 'Головний': {result}")
-            
-            if result:
-                lessons = [lesson["name"] for lesson in get_lessons()]
-            else:
-                messagebox.showerror("Помилка", "❌ Не вдалося створити урок! Можливо, є проблема з базою даних.")
-                self.create_main_menu()
-                return
-                
-            if not lessons:  # Якщо все ще немає уроків, використовуємо замінник
-                lessons = ["Головний"]
-            
-        self.lesson_var = tk.StringVar(value=lessons[0])
-        
-        lesson_dropdown = ttk.Combobox(main_container, textvariable=self.lesson_var, 
-                                     values=lessons, state="readonly", 
-                                     width=30, font=("Arial", 12))
-        lesson_dropdown.pack(pady=(0, 20))
+        # Список уроків завантажується у фоні
+        self.lesson_combo = LessonCombobox(main_container, lesson="⏳ Завантаження...",
+                                           state="disabled", width=30, font=("Arial", 12))
+        self.lesson_combo.pack(pady=(0, 20))
         
         # Вибір режиму
         tk.Label(main_container, text="Оберіть режим:", 
@@ -141,6 +207,13 @@ class WordTrainerApp:
             ("🇺🇦 Українська ➡️ 🇬🇧 Англійська", "#2ecc71", "UA-EN")
         ]
 
+        # Швидка сесія: кілька випадкових слів уроку, незалежно від розкладу
+        quick_var = tk.BooleanVar(value=self.quick_session)
+        tk.Checkbutton(main_container, text=f"⚡ Швидка сесія ({scheduler.QUICK_SESSION_SIZE} випадкових слів)",
+                       variable=quick_var, font=("Arial", 12), bg="#f0f8ff", fg="#34495e",
+                       activebackground="#f0f8ff").pack(pady=(0, 10))
+
+        mode_buttons = []
         for text, color, mode in modes:
             btn = tk.Button(main_container, text=text,
                           font=("Arial", 12),
@@ -148,8 +221,10 @@ class WordTrainerApp:
                           fg="white",
                           relief=tk.FLAT,
                           width=30,
-                          command=lambda m=mode: self.start_training(m))
+                          state=tk.DISABLED,
+                          command=lambda m=mode: self.start_training(m, quick_var.get()))
             btn.pack(pady=5)
+            mode_buttons.append(btn)
 
             # Ховер-ефект
             def on_enter(e, btn=btn, color=color):
@@ -172,49 +247,76 @@ class WordTrainerApp:
         
         back_btn.bind("<Enter>", lambda e: back_btn.configure(bg=self.darken_color("#e74c3c")))
         back_btn.bind("<Leave>", lambda e: back_btn.configure(bg="#e74c3c"))
+        
+        def on_lessons_loaded(result):
+            lessons, stats = result
+            if lessons is None:
+                messagebox.showerror("Помилка", "❌ Не вдалося створити урок! Можливо, є проблема з базою даних.")
+                self.create_main_menu()
+                return
+            self.lesson_combo.set_lessons(lessons, stats, selected=lessons[0])
+            self.lesson_combo.configure(state="readonly")
+            for btn in mode_buttons:
+                btn.configure(state=tk.NORMAL)
+        
+        self.run_db(lambda: (self.fetch_lessons(), get_lesson_stats()), on_done=on_lessons_loaded)
 
-    def start_training(self, mode):
-        """Початок тренування."""
+    def start_training(self, mode, quick=None):
+        """Початок тренування; quick=None зберігає вид попередньої сесії."""
         self.training_mode = mode
+        if quick is not None:
+            self.quick_session = quick
         self.training_data = []
         self.training_index = 0
         self.mistake_count = 0
         self.score = 0
+        self.attempts_count = 0
         
-        # Завантажуємо слова для тренування
-        selected_lesson = self.lesson_var.get()
-        words = load_words(selected_lesson)
+        # Завантажуємо у фоні лише слова, які пора повторити, або випадкову вибірку
+        selected_lesson = self.lesson_combo.get_lesson()
+        quick = self.quick_session
+        self.set_busy(True)
         
-        if not words:
-            messagebox.showwarning("Увага", f"Немає слів для тренування в уроці '{selected_lesson}'!")
+        def load_session():
+            if quick:
+                words = sample_words(selected_lesson, size=scheduler.QUICK_SESSION_SIZE)
+            else:
+                words = get_due_words(selected_lesson, limit=scheduler.SESSION_SIZE)
+            # Перевірка потрібна лише для того, щоб показати правильне повідомлення
+            return words, bool(words) or has_unlearned_words(selected_lesson)
+        
+        def on_words_loaded(session):
+            self.set_busy(False)
+            self.begin_training(selected_lesson, *session)
+        
+        def on_error(exc):
+            self.set_busy(False)
+            messagebox.showerror("Помилка", "Не вдалося завантажити слова!")
+        
+        self.run_db(load_session, on_done=on_words_loaded, on_error=on_error)
+
+    def begin_training(self, selected_lesson, words, has_unlearned):
+        """Готує слова до тренування і показує перше з них."""
+        if not has_unlearned:
+            messagebox.showinfo("Вітаємо!", f"Немає невивчених слів в уроці '{selected_lesson}'!")
             self.create_main_menu()
             return
             
-        # Створюємо список слів для тренування
-        for en_word, details in words.items():
-            if not details.get("learned", False):  # Тренуємо тільки невивчені слова
-                self.training_data.append({
-                    "english": en_word,
-                    "ukrainian": details["translation"],
-                    "lesson": details["lesson"]
-                })
-                
-        if not self.training_data:
-            messagebox.showinfo("Вітаємо!", f"Ви вивчили всі слова в уроці '{selected_lesson}'!")
+        if not words:
+            messagebox.showinfo("Вітаємо!", f"Ви повторили всі слова в уроці '{selected_lesson}'! Поверніться пізніше.")
             self.create_main_menu()
             return
             
-        # Перемішуємо слова у випадковому порядку
-        random.shuffle(self.training_data)
-            
+        # Слова вже впорядковані за терміном повторення або перемішані вибіркою
+        self.training_data = words
         self.training_ui()
 
     def training_ui(self):
         """Інтерфейс тренування."""
-        self.clear_window()
-        
         if self.training_index >= len(self.training_data):
             # Тренування завершено
+            self.clear_window()
+            self.review_log.flush()
             accuracy = ((len(self.training_data) - self.mistake_count) / len(self.training_data)) * 100
             
             # Створюємо вікно результатів
@@ -279,12 +381,8 @@ class WordTrainerApp:
             
             def restart_training():
                 result_window.destroy()
-                self.training_index = 0
-                self.mistake_count = 0
-                self.score = 0
-                self.attempts_count = 0
-                random.shuffle(self.training_data)  # Перемішуємо слова знову
-                self.training_ui()
+                # Нова сесія того самого виду: за розкладом або випадкова
+                self.start_training(self.training_mode)
             
             def return_to_menu():
                 result_window.destroy()
@@ -319,7 +417,13 @@ class WordTrainerApp:
             
             return
             
-        # Продовження тренування...
+        # Екран тренування будується один раз, далі змінюються лише тексти
+        if self.training_widgets is None:
+            self.build_training_screen()
+        self.update_training_screen()
+
+    def build_training_screen(self):
+        """Створює віджети екрана тренування."""
         # Головний контейнер
         main_container = tk.Frame(self.root, bg="#f0f8ff")
         main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
@@ -328,48 +432,27 @@ class WordTrainerApp:
         progress_frame = tk.Frame(main_container, bg="#f0f8ff")
         progress_frame.pack(fill=tk.X, pady=(0, 20))
         
-        progress = f"Слово {self.training_index + 1} з {len(self.training_data)}"
-        tk.Label(progress_frame, text=progress, 
-                font=("Arial", 12), bg="#f0f8ff", fg="#7f8c8d").pack()
+        progress_label = tk.Label(progress_frame, font=("Arial", 12), bg="#f0f8ff", fg="#7f8c8d")
+        progress_label.pack()
         
         # Прогрес-бар
-        progress_value = (self.training_index + 1) / len(self.training_data) * 100
         progress_bar = ttk.Progressbar(progress_frame, length=300, mode='determinate')
         progress_bar.pack(pady=5)
-        progress_bar['value'] = progress_value
-        
-        word = self.training_data[self.training_index]
-        self.current_word = word
-        
-        # Показуємо слово для перекладу
-        if self.training_mode == "EN-UA":
-            question = word["english"]
-            self.correct_answer = word["ukrainian"]
-            flag_from, flag_to = "🇬🇧", "🇺🇦"
-        else:
-            question = word["ukrainian"]
-            self.correct_answer = word["english"]
-            flag_from, flag_to = "🇺🇦", "🇬🇧"
         
-        # Урок
-        lesson_name = word.get("lesson", "Головний")
-        if lesson_name != "Головний":
-            tk.Label(main_container, text=f"📚 Урок: {lesson_name}",
-                    font=("Arial", 10), bg="#f0f8ff", fg="#7f8c8d").pack()
+        # Урок (показується лише для уроків, відмінних від головного)
+        lesson_label = tk.Label(main_container, font=("Arial", 10), bg="#f0f8ff", fg="#7f8c8d")
         
         # Напрямок перекладу
-        tk.Label(main_container, text=f"{flag_from} ➡️ {flag_to}",
-                font=("Arial", 14), bg="#f0f8ff").pack(pady=5)
+        direction_label = tk.Label(main_container, font=("Arial", 14), bg="#f0f8ff")
+        direction_label.pack(pady=5)
         
         # Слово для перекладу
-        tk.Label(main_container, text=question,
-                font=("Arial", 24, "bold"), bg="#f0f8ff", fg="#2c3e50").pack(pady=20)
+        question_label = tk.Label(main_container, font=("Arial", 24, "bold"),
+                                  bg="#f0f8ff", fg="#2c3e50")
+        question_label.pack(pady=20)
         
-        # Підказка (якщо є спроби)
-        if self.attempts_count > 1:
-            hint = self.correct_answer[:min(self.attempts_count-1, len(self.correct_answer))]
-            tk.Label(main_container, text=f"💡 Підказка: {hint}...",
-                    font=("Arial", 12), bg="#f0f8ff", fg="#e67e22").pack(pady=5)
+        # Підказка (показується після кількох спроб)
+        hint_label = tk.Label(main_container, font=("Arial", 12), bg="#f0f8ff", fg="#e67e22")
         
         # Поле для введення
         answer_frame = tk.Frame(main_container, bg="#f0f8ff")
@@ -380,26 +463,6 @@ class WordTrainerApp:
                               width=30,
                               justify='center')
         answer_entry.pack()
-        answer_entry.focus()
-        
-        def check_answer(event=None):
-            user_answer = answer_entry.get().strip().lower()
-            correct = self.correct_answer.lower()
-            
-            if user_answer == correct:
-                if self.attempts_count == 0:  # Правильно з першого разу
-                    self.score += 1
-                else:  # Правильно, але не з першого разу
-                    self.mistake_count += 1
-                    
-                messagebox.showinfo("✅ Правильно!", "Молодець! 👍")
-                self.training_index += 1
-                self.attempts_count = 0  # Скидаємо лічильник спроб
-                self.training_ui()
-            else:
-                self.attempts_count += 1  # Збільшуємо лічильник спроб
-                messagebox.showwarning("❌ Неправильно!", "Спробуйте ще раз!")
-                self.training_ui()
         
         # Кнопка перевірки
         check_btn = tk.Button(main_container, text="Перевірити ✓",
@@ -408,7 +471,7 @@ class WordTrainerApp:
                             fg="white",
                             relief=tk.FLAT,
                             width=15,
-                            command=check_answer)
+                            command=self.check_answer)
         check_btn.pack(pady=10)
         
         # Кнопка виходу
@@ -428,7 +491,95 @@ class WordTrainerApp:
         exit_btn.bind("<Leave>", lambda e: exit_btn.configure(bg="#e74c3c"))
         
         # Прив'язуємо Enter до перевірки
-        self.root.bind("<Return>", check_answer)
+        self.root.bind("<Return>", self.check_answer)
+        
+        self.training_widgets = {
+            "progress": progress_label,
+            "progress_bar": progress_bar,
+            "lesson": lesson_label,
+            "direction": direction_label,
+            "question": question_label,
+            "hint": hint_label,
+            "answer_frame": answer_frame,
+            "answer": answer_entry,
+        }
+
+    def update_training_screen(self):
+        """Показує поточне слово на вже створеному екрані тренування."""
+        widgets = self.training_widgets
+        
+        widgets["progress"].configure(
+            text=f"Слово {self.training_index + 1} з {len(self.training_data)}")
+        widgets["progress_bar"]['value'] = (self.training_index + 1) / len(self.training_data) * 100
+        
+        word = self.training_data[self.training_index]
+        self.current_word = word
+        if self.attempts_count == 0:
+            # Час відповіді рахуємо від першого показу слова
+            self.question_started = time.monotonic()
+        
+        # Показуємо слово для перекладу
+        if self.training_mode == "EN-UA":
+            question = word["english"]
+            self.correct_answer = word["ukrainian"]
+            flag_from, flag_to = "🇬🇧", "🇺🇦"
+        else:
+            question = word["ukrainian"]
+            self.correct_answer = word["english"]
+            flag_from, flag_to = "🇺🇦", "🇬🇧"
+        
+        # Урок
+        lesson_name = word.get("lesson", "Головний")
+        if lesson_name != "Головний":
+            widgets["lesson"].configure(text=f"📚 Урок: {lesson_name}")
+            widgets["lesson"].pack(before=widgets["direction"])
+        else:
+            widgets["lesson"].pack_forget()
+        
+        widgets["direction"].configure(text=f"{flag_from} ➡️ {flag_to}")
+        widgets["question"].configure(text=question)
+        
+        # Підказка (якщо є спроби)
+        if self.attempts_count > 1:
+            hint = self.correct_answer[:min(self.attempts_count-1, len(self.correct_answer))]
+            widgets["hint"].configure(text=f"💡 Підказка: {hint}...")
+            widgets["hint"].pack(pady=5, before=widgets["answer_frame"])
+        else:
+            widgets["hint"].pack_forget()
+        
+        widgets["answer"].delete(0, tk.END)
+        widgets["answer"].focus()
+
+    def check_answer(self, event=None):
+        """Перевіряє введену відповідь і переходить далі."""
+        if self.training_widgets is None:
+            return
+        word = self.current_word
+        user_answer = self.training_widgets["answer"].get().strip().lower()
+        correct = self.correct_answer.lower()
+        
+        if user_answer == correct:
+            if self.attempts_count == 0:  # Правильно з першого разу
+                self.score += 1
+            else:  # Правильно, але не з першого разу
+                self.mistake_count += 1
+            
+            # Оцінка відповіді визначає, коли слово з'явиться знову
+            grade = scheduler.grade_from_attempts(self.attempts_count)
+            schedule = scheduler.review(word, grade)
+            word.update(schedule)
+            self.run_db(update_schedule, word["_id"], schedule)
+            self.review_log.record(word["_id"], word["english"], word["lesson"], self.training_mode,
+                                   self.attempts_count, time.monotonic() - self.question_started)
+                
+            messagebox.showinfo("✅ Правильно!", "Молодець! 👍")
+            self.training_index += 1
+            self.attempts_count = 0  # Скидаємо лічильник спроб
+            self.training_ui()
+        else:
+            self.attempts_count += 1  # Збільшуємо лічильник спроб
+            messagebox.showwarning("❌ Неправильно!", "Спробуйте ще раз!")
+            self.training_ui()
 
     def add_word_ui(self):
         """Інтерфейс додавання нового слова."""
@@ -446,23 +597,24 @@ class WordTrainerApp:
         tk.Label(main_container, text="Урок:", 
                 font=("Arial", 14), bg="#f0f8ff", fg="#34495e").pack(pady=(0, 5))
         
-        lessons = [lesson["name"] for lesson in get_lessons()]
-        
-        # Якщо список уроків порожній, створюємо урок "Головний"
-        if not lessons:
-            print("UI: Список уроків порожній. Створюємо урок 'Головний'")
-            create_lesson("Головний")
-            lessons = [lesson["name"] for lesson in get_lessons()]
-            if not lessons:  # Якщо все ще немає уроків, використовуємо замінник
-                lessons = ["Головний"]
-        
-        self.lesson_var = tk.StringVar(value=lessons[0])
+        # Список уроків завантажується у фоні
+        self.lesson_var = tk.StringVar(value="⏳ Завантаження...")
         
         lesson_dropdown = ttk.Combobox(main_container, textvariable=self.lesson_var, 
-                                      values=lessons, state="readonly", 
+                                      values=[], state="disabled", 
                                       width=30, font=("Arial", 12))
         lesson_dropdown.pack(pady=(0, 20))
         
+        def on_lessons_loaded(lessons):
+            # Якщо урок створити не вдалося, використовуємо замінник
+            lessons = lessons or ["Головний"]
+            lesson_dropdown['values'] = lessons
+            lesson_dropdown.configure(state="readonly")
+            self.lesson_var.set(lessons[0])
+            save_btn.configure(state=tk.NORMAL)
+        
+        self.run_db(self.fetch_lessons, on_done=on_lessons_loaded)
+        
         # Поле для англійського слова
         tk.Label(main_container, text="🇬🇧 Англійське слово:", 
                 font=("Arial", 14), bg="#f0f8ff", fg="#34495e").pack(pady=(0, 5))
@@ -493,18 +645,25 @@ class WordTrainerApp:
                 return
                 
             # Зберігаємо нове слово
-            print(f"UI: Спроба зберегти слово: {english} - {ukrainian} в урок {lesson}")
-            result = save_word(english, ukrainian, lesson)
-            print(f"UI: Результат збереження слова: {result}")
+            logger.debug("UI: Спроба зберегти слово: %s - %s в урок %s", english, ukrainian, lesson)
+            save_btn.configure(state=tk.DISABLED)
+            self.set_busy(True)
             
-            if result:
-                # Очищаємо поля
-                english_entry.delete(0, tk.END)
-                ukrainian_entry.delete(0, tk.END)
+            def on_saved(result):
+                logger.debug("UI: Результат збереження слова: %s", result)
+                save_btn.configure(state=tk.NORMAL)
+                self.set_busy(False)
                 
-                messagebox.showinfo("Успіх", "✅ Слово успішно додано!")
-            else:
-                messagebox.showerror("Помилка", "❌ Не вдалося зберегти слово! Можливо, таке слово вже існує або є проблема з базою даних.")
+                if result:
+                    # Очищаємо поля
+                    english_entry.delete(0, tk.END)
+                    ukrainian_entry.delete(0, tk.END)
+                    
+                    messagebox.showinfo("Успіх", "✅ Слово успішно додано!")
+                else:
+                    messagebox.showerror("Помилка", "❌ Не вдалося зберегти слово! Можливо, таке слово вже існує або є проблема з базою даних.")
+            
+            self.run_db(save_word, english, ukrainian, lesson, on_done=on_saved, on_error=lambda exc: on_saved(False))
             
         # Кнопка збереження
         save_btn = tk.Button(main_container, text="💾 Зберегти",
@@ -513,6 +672,7 @@ class WordTrainerApp:
                            fg="white",
                            relief=tk.FLAT,
                            width=15,
+                           state=tk.DISABLED,
                            command=save_new_word)
         save_btn.pack(pady=10)
         
@@ -520,18 +680,25 @@ class WordTrainerApp:
         def create_new_lesson():
             lesson_name = simpledialog.askstring("Новий урок", "Введіть назву нового уроку:")
             if lesson_name:
-                print(f"UI: Спроба створити урок: {lesson_name}")
-                result = create_lesson(lesson_name)
-                print(f"UI: Результат створення уроку: {result}")
+                logger.debug("UI: Спроба створити урок: %s", lesson_name)
                 
-                if result:
-                    # Оновлюємо список уроків
-                    lessons = [lesson["name"] for lesson in get_lessons()]
-                    lesson_dropdown['values'] = lessons
-                    self.lesson_var.set(lesson_name)
-                    messagebox.showinfo("Успіх", "✅ Урок успішно створено!")
-                else:
-                    messagebox.showerror("Помилка", "❌ Не вдалося створити урок! Можливо, урок з такою назвою вже існує або є проблема з базою даних.")
+                def create_and_list():
+                    result = create_lesson(lesson_name)
+                    return result, get_lesson_names() if result else None
+                
+                def on_created(outcome):
+                    result, lessons = outcome
+                    logger.debug("UI: Результат створення уроку: %s", result)
+                    
+                    if result:
+                        # Оновлюємо список уроків
+                        lesson_dropdown['values'] = lessons
+                        self.lesson_var.set(lesson_name)
+                        messagebox.showinfo("Успіх", "✅ Урок успішно створено!")
+                    else:
+                        messagebox.showerror("Помилка", "❌ Не вдалося створити урок! Можливо, урок з такою назвою вже існує або є проблема з базою даних.")
+                
+                self.run_db(create_and_list, on_done=on_created, on_error=lambda exc: on_created((False, None)))
         
         new_lesson_btn = tk.Button(main_container, text="📚 Створити урок",
                                 font=("Arial", 12),
@@ -584,22 +751,22 @@ class WordTrainerApp:
         tk.Label(lesson_frame, text="Урок:", 
                 font=("Arial", 12), bg="#f0f8ff", fg="#34495e").pack(side=tk.LEFT, padx=5)
         
-        # Отримуємо список уроків
-        lessons = ["Всі уроки"] + [lesson["name"] for lesson in get_lessons()]
-        lesson_var = tk.StringVar(value="Головний")
-        
-        # Комбобокс для вибору уроку
-        lesson_combo = ttk.Combobox(lesson_frame, 
-                                  textvariable=lesson_var,
-                                  values=lessons,
-                                  state="readonly",
-                                  font=("Arial", 12),
-                                  width=20)
+        # Список уроків і кількість слів у них завантажуються у фоні
+        lesson_combo = LessonCombobox(lesson_frame, include_all=True, lesson="Головний",
+                                      font=("Arial", 12), width=28)
         lesson_combo.pack(side=tk.LEFT, padx=5)
+        
+        def load_lesson_names():
+            return get_lesson_names(), get_lesson_stats()
+        
+        def on_lessons_loaded(result):
+            lesson_combo.set_lessons(*result)
+        
+        self.run_db(load_lesson_names, on_done=on_lessons_loaded)
 
         def rename_current_lesson():
-            current_lesson = lesson_var.get()
-            if current_lesson == "Всі уроки":
+            current_lesson = lesson_combo.get_lesson()
+            if current_lesson == ALL_LESSONS:
                 messagebox.showwarning("Попередження", "Виберіть конкретний урок для перейменування!")
                 return
                 
@@ -608,16 +775,22 @@ class WordTrainerApp:
                                             initialvalue=current_lesson)
             
             if new_name and new_name != current_lesson:
-                if rename_lesson(current_lesson, new_name):
-                    # Оновлюємо список уроків
-                    lessons = ["Всі уроки"] + [lesson["name"] for lesson in get_lessons()]
-                    lesson_combo['values'] = lessons
-                    lesson_var.set(new_name)
-                    # Оновлюємо список слів
-                    update_words_list()
-                    messagebox.showinfo("Успіх", "✅ Урок успішно перейменовано!")
-                else:
-                    messagebox.showerror("Помилка", "Не вдалося перейменувати урок!")
+                def rename_and_list():
+                    if not rename_lesson(current_lesson, new_name):
+                        return None
+                    return load_lesson_names()
+                
+                def on_renamed(lessons):
+                    if lessons is not None:
+                        # Оновлюємо список уроків
+                        lesson_combo.set_lessons(*lessons, selected=new_name)
+                        # Оновлюємо список слів
+                        update_words_list(lesson_name=new_name)
+                        messagebox.showinfo("Успіх", "✅ Урок успішно перейменовано!")
+                    else:
+                        messagebox.showerror("Помилка", "Не вдалося перейменувати урок!")
+                
+                self.run_db(rename_and_list, on_done=on_renamed, on_error=lambda exc: on_renamed(None))
         
         # Кнопка для перейменування уроку
         rename_btn = tk.Button(lesson_frame,
@@ -635,76 +808,203 @@ class WordTrainerApp:
         
         def filter_words(event=None):
             """Фільтрує слова за вибраним уроком."""
-            selected_lesson = lesson_var.get()
-            if selected_lesson == "Всі уроки":
+            selected_lesson = lesson_combo.get_lesson()
+            if selected_lesson == ALL_LESSONS:
                 selected_lesson = None
             update_words_list(lesson_name=selected_lesson)
         
         lesson_combo.bind('<<ComboboxSelected>>', filter_words)
         
+        # Пошук за англійським словом або перекладом
+        search_frame = tk.Frame(main_container, bg="#f0f8ff")
+        search_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        tk.Label(search_frame, text="🔍 Пошук:", 
+                font=("Arial", 12), bg="#f0f8ff", fg="#34495e").pack(side=tk.LEFT, padx=5)
+        
+        search_var = tk.StringVar()
+        search_entry = tk.Entry(search_frame, textvariable=search_var, font=("Arial", 12), width=25)
+        search_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        
         # Фрейм для списку слів
         words_frame = tk.Frame(main_container, bg="#f0f8ff")
         words_frame.pack(fill=tk.BOTH, expand=True, padx=10)
         
-        # Створюємо скроллбар
-        scrollbar = ttk.Scrollbar(words_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Ширина колонки англійських слів; рахується один раз при завантаженні
+        fixed_width = [10]
         
-        # Створюємо список
-        words_list = tk.Listbox(words_frame, 
+        def format_row(record):
+            return f"❌ {record.english:<{fixed_width[0]}}{record.translation}"
+        
+        # Список малює лише видимі рядки, тому розмір словника не впливає на швидкість
+        # Стрілки вгору/вниз обробляє сам VirtualList
+        words_list = VirtualList(words_frame,
+                      format_row=format_row,
+                      on_select=lambda index: create_word_buttons(index),
+                      on_scroll_end=lambda: load_next_page(),
                       font=("Consolas", 14),
                       bg="white",
-                      selectmode=tk.SINGLE,
                       height=15,
                       width=40,
                       selectbackground="#e0e0e0",
                       selectforeground="#00d303",
                       activestyle="none",
-                      highlightthickness=0,
-                      yscrollcommand=scrollbar.set)
-        words_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        scrollbar.config(command=words_list.yview)
-
-        # Додаємо обробник клавіш для коректної роботи стрілок
-        def on_key_press(event):
-            if event.keysym == 'Up' or event.keysym == 'Down':
-            # Отримуємо поточний вибір
-                selection = words_list.curselection()
-                if selection:
-                    index = selection[0]
-                    if event.keysym == 'Up' and index > 0:
-                            words_list.selection_clear(0, tk.END)
-                            words_list.selection_set(index - 1)
-                            words_list.see(index - 1)
-                            words_list.event_generate('<<ListboxSelect>>')
-                    elif event.keysym == 'Down' and index < words_list.size() - 1:
-                            words_list.selection_clear(0, tk.END)
-                            words_list.selection_set(index + 1)
-                            words_list.see(index + 1)
-                            words_list.event_generate('<<ListboxSelect>>')
-                return 'break'  # Забороняємо стандартну обробку
-
-            # Прив'язуємо обробник подій клавіатури
-        words_list.bind('<KeyPress>', on_key_press)
+                      highlightthickness=0)
+        words_list.pack(fill=tk.BOTH, expand=True)
+        
+        # Відсортовані слова, які показує список; завантажуються сторінками
+        # під час прокрутки і змінюються точково після кожної дії
+        word_model = WordListModel()
+        # Індекс для пошуку будується у фоні лише під час першого пошуку
+        search_index = [None]
+        index_request = [None]  # Запит, для якого індекс уже будується
+        search_job = [None]
+        
+        def build_search_index():
+            """Завантажує всі слова уроку і будує з них індекс пошуку."""
+            request = load_request[0]
+            lesson_name = current_lesson[0]
+            words_list.set_placeholder("⏳ Пошук...")
+            if index_request[0] == request:
+                return
+            index_request[0] = request
+            
+            def load_and_index():
+                return PrefixIndex(load_words(lesson_name, False).values())
+            
+            def on_indexed(index):
+                if request != load_request[0]:
+                    return
+                search_index[0] = index
+                if search_var.get().strip():
+                    show_search_results()
+            
+            def on_index_error(exc):
+                if request == load_request[0]:
+                    index_request[0] = None
+            
+            self.run_db(load_and_index, on_done=on_indexed, on_error=on_index_error)
+        
+        def show_search_results(keep_position=False):
+            """Показує слова, що відповідають рядку пошуку, або всі слова."""
+            search_job[0] = None
+            query = search_var.get().strip()
+            if not query:
+                words_list.set_items(word_model.items, keep_position)
+                return
+            if search_index[0] is None:
+                build_search_index()
+                return
+            found = search_index[0].search(query)
+            words_list.set_items(found, keep_position)
+            if not found and len(query) >= 3:
+                # Жодне слово не починається з запиту: шукаємо за фрагментом і з помилками
+                lesson_name = lesson_combo.get_lesson()
+                
+                def find_similar():
+                    return search_words(query, lesson_name=lesson_name, learned=False)
+                
+                def on_fuzzy_found(items):
+                    if search_var.get().strip() == query:
+                        words_list.set_items([item for item in items if word_model.accepts(item)])
+                
+                self.run_db(find_similar, on_done=on_fuzzy_found)
+        
+        def on_search_changed(*args):
+            # Пошук запускається, коли користувач зробить паузу у введенні
+            if search_job[0] is not None:
+                self.root.after_cancel(search_job[0])
+            search_job[0] = self.root.after(SEARCH_DELAY_MS, show_search_results)
+        
+        search_var.trace_add("write", on_search_changed)
+        
+        def apply_change(old, record):
+            """Оновлює в списку лише рядок зміненого слова old. Повертає його нову позицію."""
+            word_id = old.id
+            old_index, new_index = word_model.update(word_id, record or None)
+            if search_index[0] is not None:
+                keep = record and word_model.accepts(record)
+                search_index[0].update(word_id, record if keep else None)
+            if new_index is not None:
+                fixed_width[0] = max(fixed_width[0], len(record.english) + 10)
+            if search_var.get().strip():
+                # Результати пошуку складаються заново; виділення переходить
+                # на змінене слово, якщо воно досі відповідає пошуку
+                show_search_results(keep_position=True)
+                new_index = None
+                if record:
+                    for index, item in enumerate(words_list.items):
+                        if item.id == record.id:
+                            new_index = index
+                            break
+                words_list.selected = new_index
+                words_list.refresh()
+            else:
+                words_list.patched(old_index, new_index)
+            if words_list.selection() is None:
+                # Вибраного слова більше немає у списку
+                for widget in word_actions_frame.winfo_children():
+                    widget.destroy()
+            # Лічильники уроків змінюються лише для цього слова, без нового підрахунку в базі
+            lesson_combo.apply_change(old, record or None)
+            return new_index
+        
+        # Номер останнього запиту: відповіді на старіші запити ігноруються
+        load_request = [0]
+        current_lesson = [None]
+        page_loading = [False]
         
         def update_words_list(select_index=None, lesson_name=None):
-            """Оновлює список невивчених слів."""
-            words_list.delete(0, tk.END)
-            words = load_words(lesson_name, show_learned=False)  # Показуємо тільки невивчені слова
-            # Знаходимо найдовше англійське слово для вирівнювання
-            max_eng_len = max(len(word) for word in words.keys()) if words else 0
-            fixed_width = max_eng_len + 10  # Додаємо відступ після англійського слова
+            """Оновлює список невивчених слів, починаючи з першої сторінки."""
+            load_request[0] += 1
+            request = load_request[0]
+            current_lesson[0] = lesson_name
+            search_index[0] = None
+            page_loading[0] = True
+            words_list.set_placeholder("⏳ Завантаження...")
             
-            # Сортуємо слова за англійським алфавітом
-            sorted_words = sorted(words.items(), key=lambda x: x[0].lower())
+            def on_words_loaded(page):
+                if request != load_request[0]:
+                    return
+                page_loading[0] = False
+                # Знаходимо найдовше англійське слово для вирівнювання
+                max_eng_len = max((len(record.english) for record in page), default=0)
+                fixed_width[0] = max_eng_len + 10  # Додаємо відступ після англійського слова
+                
+                # Сервер уже відсортував слова; у списку лишаються
+                # тільки невивчені слова вибраного уроку
+                word_model.reset(page, accept=lambda record: not record.learned
+                                 and lesson_name in (None, record.lesson),
+                                 complete=len(page) < DEFAULT_PAGE_SIZE)
+                show_search_results()
+                if select_index is not None:
+                    words_list.select(select_index)
+            
+            # Показуємо тільки невивчені слова
+            self.run_db(load_words_page, lesson_name, False, on_done=on_words_loaded)
+        
+        def load_next_page():
+            """Підвантажує наступну сторінку, коли список прокручено до кінця."""
+            if word_model.complete or page_loading[0] or search_var.get().strip():
+                return
+            page_loading[0] = True
+            request = load_request[0]
             
-            for en_word, details in sorted_words:
-                ua_word = details["translation"]
-                words_list.insert(tk.END, f"❌ {en_word:<{fixed_width}}{ua_word}")
-            if select_index is not None and select_index < words_list.size():
-                words_list.selection_set(select_index)
-                create_word_buttons(select_index)
+            def on_page_loaded(page):
+                if request != load_request[0]:
+                    return
+                page_loading[0] = False
+                word_model.extend(page, complete=len(page) < DEFAULT_PAGE_SIZE)
+                fixed_width[0] = max([fixed_width[0]] + [len(record.english) + 10 for record in page])
+                if not search_var.get().strip():
+                    words_list.set_items(word_model.items, keep_position=True)
+            
+            def on_page_error(exc):
+                if request == load_request[0]:
+                    page_loading[0] = False
+            
+            self.run_db(load_words_page, current_lesson[0], False, word_model.last(),
+                        on_done=on_page_loaded, on_error=on_page_error)
         
         # Початкове завантаження слів для уроку "Головний"
         update_words_list(lesson_name="Головний")
@@ -721,23 +1021,20 @@ class WordTrainerApp:
             if not (0 <= index < words_list.size()):
                 return
                 
-            item = words_list.get(index)
-            # Отримуємо англійське слово (між статусом і перекладом)
-            # Формат рядка: "❌ {en_word:<{fixed_width}}{ua_word}"
-            # Видаляємо символ статусу і пробіл
-            cleaned_item = item[2:].strip()
-            # Розділяємо на англійське слово та переклад (англійське слово має фіксовану ширину з пробілами)
-            en_word = cleaned_item.strip().split()[0]
+            # Рядок списку — це позиція в items, тож запис і його id беруться одразу
+            record = words_list.items[index]
+            word_id = record.id
             
             def toggle_learned_state():
-                if toggle_word_learned(en_word):
-                    # Оновлюємо список слів, зберігаючи поточний урок
-                    current_lesson = lesson_var.get()
-                    if current_lesson == "Всі уроки":
-                        current_lesson = None
-                    update_words_list(lesson_name=current_lesson)
-                else:
-                    messagebox.showerror("Помилка", "Не вдалося змінити статус слова!")
+                def on_toggled(result):
+                    if result:
+                        # Вивчене слово зникає зі списку, решта рядків не змінюється
+                        apply_change(record, result)
+                    else:
+                        messagebox.showerror("Помилка", "Не вдалося змінити статус слова!")
+                
+                self.run_db(toggle_word_learned, word_id, record,
+                            on_done=on_toggled, on_error=lambda exc: on_toggled(False))
             
             # Кнопка позначення слова як вивченого
             learn_btn = tk.Button(word_actions_frame,
@@ -756,7 +1053,7 @@ class WordTrainerApp:
                                bg="#3498db",
                                fg="white",
                                relief=tk.FLAT,
-                               command=lambda: edit_word(en_word, index))
+                               command=lambda: edit_word(record))
             edit_btn.pack(side=tk.LEFT, padx=5, expand=True)
             
             # Кнопка видалення
@@ -766,7 +1063,7 @@ class WordTrainerApp:
                                 bg="#e74c3c",
                                 fg="white",
                                 relief=tk.FLAT,
-                                command=lambda: delete_word(en_word, index))
+                                command=lambda: delete_word(record))
             delete_btn.pack(side=tk.LEFT, padx=5, expand=True)
             
             # Ховер-ефекти
@@ -776,24 +1073,12 @@ class WordTrainerApp:
                 btn.bind("<Leave>", lambda e, btn=btn, color=color: 
                         btn.configure(bg=color))
         
-        def on_select(event):
-            selection = words_list.curselection()
-            if selection:
-                create_word_buttons(selection[0])
-        
-        words_list.bind('<<ListboxSelect>>', on_select)
-        
-        def edit_word(en_word, index):
+        def edit_word(record):
             """Редагує вибране слово."""
-            # Отримуємо деталі слова
-            words = load_words()
-            if en_word not in words:
-                messagebox.showerror("Помилка", "Слово не знайдено!")
-                return
-                
-            word_details = words[en_word]
-            ua_word = word_details["translation"]
-            current_lesson = word_details.get("lesson", "Головний")
+            # Запис у рядку списку вже містить усі поля слова
+            en_word = record.english
+            ua_word = record.translation
+            current_lesson = record.lesson
             
             # Створюємо діалогове вікно для редагування
             edit_window = tk.Toplevel(self.root)
@@ -857,7 +1142,8 @@ class WordTrainerApp:
             tk.Label(input_frame, text="Урок:", 
                    font=("Arial", 12), bg="#f0f8ff", fg="#34495e").pack(anchor=tk.W, pady=(0, 5))
             
-            lessons = [lesson["name"] for lesson in get_lessons()]
+            # Уроки вже завантажені для комбобокса словника
+            lessons = lesson_combo.lessons()
             lesson_var = tk.StringVar(value=current_lesson)
             
             lesson_dropdown = ttk.Combobox(input_frame, textvariable=lesson_var, 
@@ -882,18 +1168,24 @@ class WordTrainerApp:
                 # Імпортуємо функцію оновлення слова
                 from db import update_word
                 
+                def on_updated(result):
+                    if result:
+                        messagebox.showinfo("Успіх", "✅ Слово успішно оновлено!")
+                        edit_window.destroy()
+                        
+                        # Переставляємо лише змінений рядок на його нове місце
+                        new_index = apply_change(record, result)
+                        if new_index is not None:
+                            words_list.select(new_index)
+                    else:
+                        if edit_window.winfo_exists():
+                            save_btn.configure(state=tk.NORMAL)
+                        messagebox.showerror("Помилка", "Не вдалося оновити слово! Можливо, слово з такою назвою вже існує.")
+                
                 # Оновлюємо слово в базі даних
-                if update_word(en_word, new_english, new_ukrainian, new_lesson):
-                    messagebox.showinfo("Успіх", "✅ Слово успішно оновлено!")
-                    edit_window.destroy()
-                    
-                    # Оновлюємо список слів
-                    current_lesson_filter = lesson_var.get()
-                    if current_lesson_filter == "Всі уроки":
-                        current_lesson_filter = None
-                    update_words_list(lesson_name=current_lesson_filter)
-                else:
-                    messagebox.showerror("Помилка", "Не вдалося оновити слово! Можливо, слово з такою назвою вже існує.")
+                save_btn.configure(state=tk.DISABLED)
+                self.run_db(update_word, record.id, new_english, new_ukrainian, new_lesson, record,
+                            on_done=on_updated, on_error=lambda exc: on_updated(False))
             
             # Кнопка збереження
             save_btn = tk.Button(button_frame, text="💾 Зберегти",
@@ -925,18 +1217,17 @@ class WordTrainerApp:
             # Фокус на перше поле
             english_entry.focus()
         
-        def delete_word(en_word, index):
-            if messagebox.askyesno("Підтвердження", f"Ви впевнені, що хочете видалити слово '{en_word}'?"):
-                words = load_words()
-                if en_word in words:
-                    del words[en_word]
-                    from db import save_words
-                    save_words(words)
-                    update_words_list()
-                    # Очищаємо фрейм з кнопками
-                    for widget in word_actions_frame.winfo_children():
-                        widget.destroy()
-                    messagebox.showinfo("Успіх", "✅ Слово успішно видалено!")
+        def delete_word(record):
+            if messagebox.askyesno("Підтвердження", f"Ви впевнені, що хочете видалити слово '{record.english}'?"):
+                def on_deleted(result):
+                    if result:
+                        # Прибираємо лише рядок видаленого слова
+                        apply_change(record, None)
+                        messagebox.showinfo("Успіх", "✅ Слово успішно видалено!")
+                    else:
+                        messagebox.showerror("Помилка", "Не вдалося видалити слово!")
+                
+                self.run_db(db_delete_word, record.id, on_done=on_deleted, on_error=lambda exc: on_deleted(False))
         
         # Кнопка "Назад"
         back_btn = tk.Button(main_container, 
@@ -972,38 +1263,29 @@ class WordTrainerApp:
         tk.Label(lesson_frame, text="Урок:", 
                 font=("Arial", 12), bg="#f0f8ff", fg="#34495e").pack(side=tk.LEFT, padx=5)
         
-        # Отримуємо список уроків
-        lessons = ["Всі уроки"] + [lesson["name"] for lesson in get_lessons()]
-        lesson_var = tk.StringVar(value="Головний")  # Встановлюємо "Головний" за замовчуванням
-        
-        # Комбобокс для вибору уроку
-        lesson_combo = ttk.Combobox(lesson_frame, 
-                                  textvariable=lesson_var,
-                                  values=lessons,
-                                  state="readonly",
-                                  font=("Arial", 12),
-                                  width=20)
+        # Список уроків і кількість слів у них завантажуються у фоні
+        lesson_combo = LessonCombobox(lesson_frame, include_all=True, lesson="Головний",
+                                      font=("Arial", 12), width=28)
         lesson_combo.pack(side=tk.LEFT, padx=5)
         
+        def on_lessons_loaded(result):
+            lesson_combo.set_lessons(*result)
+        
+        self.run_db(lambda: (get_lesson_names(), get_lesson_stats()), on_done=on_lessons_loaded)
+        
         # Фрейм для списку слів
         words_frame = tk.Frame(main_container, bg="#f0f8ff")
         words_frame.pack(fill=tk.BOTH, expand=True, padx=10)
         
-        # Створюємо скроллбар
-        scrollbar = ttk.Scrollbar(words_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Створюємо список
-        words_list = tk.Listbox(words_frame, 
+        # Створюємо список, що малює лише видимі рядки
+        words_list = VirtualList(words_frame,
+                              format_row=lambda record: f"✅ {record.english} - {record.translation}",
+                              on_select=lambda index: create_word_buttons(index),
                               font=("Arial", 12),
                               bg="white",
-                              selectmode=tk.SINGLE,
                               height=15,
-                              width=40,
-                              yscrollcommand=scrollbar.set)
-        words_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        scrollbar.config(command=words_list.yview)
+                              width=40)
+        words_list.pack(fill=tk.BOTH, expand=True)
         
         # Фрейм для кнопок дій зі словами
         word_actions_frame = tk.Frame(main_container, bg="#f0f8ff")
@@ -1017,24 +1299,23 @@ class WordTrainerApp:
             if not (0 <= index < words_list.size()):
                 return
                 
-            item = words_list.get(index)
-            # Отримуємо англійське слово (між статусом і перекладом)
-            # Формат рядка: "❌ {en_word:<{fixed_width}}{ua_word}"
-            # Видаляємо символ статусу і пробіл
-            cleaned_item = item[2:].strip()
-            # Розділяємо на англійське слово та переклад (англійське слово має фіксовану ширину з пробілами)
-            en_word = cleaned_item.strip().split()[0]
+            record = word_model[index]
+            word_id = record.id
             
             def toggle_learned_state():
-                if toggle_word_learned(en_word):
-                    messagebox.showinfo("Успіх", "✅ Слово повернуто в словник!")
-                    # Оновлюємо список слів, зберігаючи поточний урок
-                    current_lesson = lesson_var.get()
-                    if current_lesson == "Всі уроки":
-                        current_lesson = None
-                    update_learned_words_list(lesson_name=current_lesson)
-                else:
-                    messagebox.showerror("Помилка", "Не вдалося змінити статус слова!")
+                def on_toggled(result):
+                    if result:
+                        messagebox.showinfo("Успіх", "✅ Слово повернуто в словник!")
+                        # Прибираємо лише рядок цього слова
+                        words_list.patched(*word_model.update(word_id, result))
+                        for widget in word_actions_frame.winfo_children():
+                            widget.destroy()
+                        lesson_combo.apply_change(record, result)
+                    else:
+                        messagebox.showerror("Помилка", "Не вдалося змінити статус слова!")
+                
+                self.run_db(toggle_word_learned, word_id, record,
+                            on_done=on_toggled, on_error=lambda exc: on_toggled(False))
             
             # Кнопка повернення слова в словник
             unlearn_btn = tk.Button(word_actions_frame,
@@ -1050,32 +1331,34 @@ class WordTrainerApp:
             unlearn_btn.bind("<Enter>", lambda e: unlearn_btn.configure(bg=self.darken_color("#e74c3c")))
             unlearn_btn.bind("<Leave>", lambda e: unlearn_btn.configure(bg="#e74c3c"))
         
-        def on_select(event):
-            selection = words_list.curselection()
-            if selection:
-                create_word_buttons(selection[0])
+        # Відсортовані вивчені слова, які показує список
+        word_model = WordListModel()
         
-        words_list.bind('<<ListboxSelect>>', on_select)
+        # Номер останнього запиту: відповіді на старіші запити ігноруються
+        load_request = [0]
         
         def update_learned_words_list(lesson_name=None):
             """Оновлює список вивчених слів."""
-            words_list.delete(0, tk.END)
-            words = load_words(lesson_name, show_learned=True)
-            
-            # Сортуємо слова за англійським алфавітом
-            sorted_words = sorted(words.items(), key=lambda x: x[0].lower())
-            
-            for en_word, details in sorted_words:
-                ua_word = details["translation"]
-                words_list.insert(tk.END, f"✅ {en_word} - {ua_word}")
+            words_list.set_placeholder("⏳ Завантаження...")
             # Очищаємо фрейм з кнопками
             for widget in word_actions_frame.winfo_children():
                 widget.destroy()
+            load_request[0] += 1
+            request = load_request[0]
+            
+            def on_words_loaded(words):
+                if request != load_request[0]:
+                    return
+                # Сортуємо слова за англійським алфавітом
+                word_model.reset(words.values(), accept=lambda record: record.learned)
+                words_list.set_items(word_model.items)
+            
+            self.run_db(load_words, lesson_name, True, on_done=on_words_loaded)
         
         def filter_words(event=None):
             """Фільтрує слова за вибраним уроком."""
-            selected_lesson = lesson_var.get()
-            if selected_lesson == "Всі уроки":
+            selected_lesson = lesson_combo.get_lesson()
+            if selected_lesson == ALL_LESSONS:
                 selected_lesson = None
             update_learned_words_list(selected_lesson)
         
@@ -1101,4 +1384,17 @@ class WordTrainerApp:
 def run_ui():
     root = tk.Tk()
     app = WordTrainerApp(root)
-    root.mainloop()     
\ No newline at end of file
+    
+    def on_first_map(event):
+        # Драйвер бази імпортується і підключається лише після того, як вікно
+        # вперше намальовано, щоб фоновий потік не затримував перший кадр
+        if event.widget is root:
+            root.unbind("<Map>", bind_id)
+            root.after_idle(lambda: app.run_db(warm_up))
+    
+    bind_id = root.bind("<Map>", on_first_map)
+    root.mainloop()
+    app.review_log.flush()
+    # Чекаємо, поки фонові записи завершаться
+    app.db_executor.shutdown(wait=True)
+    logger.info("Показники операцій з базою:\n%s", metrics.format_report())     
\ No newline at end of file
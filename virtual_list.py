@@ -0,0 +1,185 @@
+"""
+Віртуалізований список для великих словників.
+
+Listbox містить лише ті рядки, які зараз видно на екрані; усі елементи
+зберігаються у звичайному списку Python, а рядки для показу формуються
+функцією format_row тільки для видимого вікна.
+
+Якщо елементи завантажуються сторінками, on_scroll_end викликається, коли
+видиме вікно наближається до кінця вже завантаженої частини.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualList(tk.Frame):
+    """Список зі скролбаром, що показує лише видиме вікно елементів."""
+
+    def __init__(self, master, format_row=str, on_select=None, height=15, on_scroll_end=None,
+                 **listbox_options):
+        super().__init__(master, bg=master.cget("bg"))
+        self.format_row = format_row
+        self.on_select = on_select
+        self.on_scroll_end = on_scroll_end
+        self.items = []
+        self.top = 0  # Індекс першого видимого елемента
+        self.visible_rows = height
+        self.selected = None
+        self.placeholder = None
+
+        self.scrollbar = ttk.Scrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.listbox = tk.Listbox(self, height=height, selectmode=tk.SINGLE,
+                                  exportselection=False, **listbox_options)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.listbox.bind("<<ListboxSelect>>", self._on_listbox_select)
+        self.listbox.bind("<KeyPress>", self._on_key_press)
+        self.listbox.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.listbox.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.listbox.bind("<Button-5>", lambda e: self.scroll(3))
+        self.listbox.bind("<Configure>", self._on_configure)
+
+    def size(self):
+        return len(self.items)
+
+    def set_items(self, items, keep_position=False):
+        """Замінює всі елементи списку; items мають бути вже відсортовані."""
+        self.items = items
+        self.placeholder = None
+        if not keep_position:
+            self.top = 0
+            self.selected = None
+        elif self.selected is not None and self.selected >= len(items):
+            self.selected = None
+        self.refresh()
+
+    def set_placeholder(self, text):
+        """Показує текст замість елементів, наприклад під час завантаження."""
+        self.items = []
+        self.top = 0
+        self.selected = None
+        self.placeholder = text
+        self.refresh()
+
+    def patched(self, old_index=None, new_index=None):
+        """Перемальовує список після зміни одного елемента у self.items.
+
+        old_index — звідки елемент видалено, new_index — куди вставлено.
+        Прокрутка і виділення зберігаються; якщо змінено вибраний елемент,
+        виділення переходить на його нову позицію.
+        """
+        selected = self.selected
+        follows = selected is not None and selected == old_index
+        if old_index is not None:
+            if old_index < self.top:
+                self.top -= 1
+            if selected is not None and not follows and selected > old_index:
+                selected -= 1
+        if follows:
+            selected = new_index
+        elif new_index is not None and selected is not None and selected >= new_index:
+            selected += 1
+        if new_index is not None and new_index < self.top:
+            self.top += 1
+        self.selected = selected
+        self.refresh()
+
+    def selection(self):
+        """Індекс вибраного елемента або None."""
+        return self.selected
+
+    def select(self, index):
+        """Вибирає елемент, прокручує до нього і повідомляє on_select."""
+        if not (0 <= index < len(self.items)):
+            return
+        self.selected = index
+        self.see(index)
+        if self.on_select is not None:
+            self.on_select(index)
+
+    def see(self, index):
+        """Прокручує список так, щоб елемент було видно."""
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self.visible_rows:
+            self.top = index - self.visible_rows + 1
+        self.refresh()
+
+    def scroll(self, rows):
+        self.top += rows
+        self.refresh()
+
+    def refresh(self):
+        """Перемальовує видиме вікно елементів."""
+        max_top = max(0, len(self.items) - self.visible_rows)
+        self.top = min(max(0, self.top), max_top)
+
+        self.listbox.delete(0, tk.END)
+        if self.placeholder is not None:
+            self.listbox.insert(tk.END, self.placeholder)
+            self.scrollbar.set(0, 1)
+            return
+
+        window = self.items[self.top:self.top + self.visible_rows]
+        if window:
+            self.listbox.insert(tk.END, *(self.format_row(item) for item in window))
+        if self.selected is not None and self.top <= self.selected < self.top + len(window):
+            self.listbox.selection_set(self.selected - self.top)
+
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.top / total, (self.top + len(window)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+        # Підвантажуємо наступну сторінку заздалегідь, за один екран до кінця
+        if self.on_scroll_end is not None and self.top + 2 * self.visible_rows >= total:
+            self.on_scroll_end()
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.top = int(float(args[0]) * len(self.items))
+            self.refresh()
+        elif action == "scroll":
+            amount, what = int(args[0]), args[1]
+            self.scroll(amount * self.visible_rows if what == "pages" else amount)
+
+    def _on_mouse_wheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _on_configure(self, event):
+        # Кількість видимих рядків залежить від висоти віджета
+        bbox = self.listbox.bbox(0)
+        if bbox and bbox[3] > 0:
+            rows = max(1, event.height // bbox[3])
+            if rows != self.visible_rows:
+                self.visible_rows = rows
+                self.refresh()
+
+    def _on_listbox_select(self, event):
+        selection = self.listbox.curselection()
+        if selection and self.placeholder is None:
+            self.select(self.top + selection[0])
+
+    def _on_key_press(self, event):
+        steps = {
+            "Up": -1,
+            "Down": 1,
+            "Prior": -self.visible_rows,
+            "Next": self.visible_rows,
+        }
+        if event.keysym in steps:
+            if self.selected is not None:
+                index = min(max(0, self.selected + steps[event.keysym]), len(self.items) - 1)
+                if index != self.selected:
+                    self.select(index)
+            return "break"  # Забороняємо стандартну обробку
+        if event.keysym == "Home" and self.items:
+            self.select(0)
+            return "break"
+        if event.keysym == "End" and self.items:
+            self.select(len(self.items) - 1)
+            return "break"
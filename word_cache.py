@@ -0,0 +1,93 @@
+"""
+Кеш слів у пам'яті, розділений за уроком і статусом вивчення.
+
+Кожен розділ містить те саме, що повертає load_words для пари
+(урок, вивчене): {_id: WordRecord}.
+Урок None означає "Всі уроки". Функції запису в db.py оновлюють кеш
+на місці, тому повторне відкриття списку не звертається до бази.
+"""
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_WORDS = 100_000
+
+
+class WordCache:
+    """LRU-кеш розділів слів з обмеженням на загальну кількість слів."""
+
+    def __init__(self, max_words=DEFAULT_MAX_WORDS):
+        self.max_words = max_words
+        self._partitions = OrderedDict()  # (урок, вивчене) -> {_id: WordRecord}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._size
+
+    def get(self, lesson_name, learned):
+        """Повертає копію розділу або None, якщо його немає в кеші."""
+        key = (lesson_name, learned)
+        with self._lock:
+            words = self._partitions.get(key)
+            if words is None:
+                return None
+            self._partitions.move_to_end(key)
+            return dict(words)
+
+    def put(self, lesson_name, learned, words):
+        """Зберігає розділ, витісняючи найдавніше використані розділи."""
+        key = (lesson_name, learned)
+        with self._lock:
+            self._drop(key)
+            if len(words) > self.max_words:
+                return
+            self._partitions[key] = dict(words)
+            self._size += len(words)
+            self._evict()
+
+    def add_word(self, record):
+        """Додає слово в усі розділи, до яких воно належить."""
+        with self._lock:
+            for key in ((record.lesson, record.learned), (None, record.learned)):
+                words = self._partitions.get(key)
+                if words is not None:
+                    if record.id not in words:
+                        self._size += 1
+                    words[record.id] = record
+            self._evict()
+
+    def get_word(self, word_id):
+        """Слово з будь-якого розділу або None."""
+        with self._lock:
+            for words in self._partitions.values():
+                record = words.get(word_id)
+                if record is not None:
+                    return record
+        return None
+
+    def remove_word(self, word_id):
+        """Прибирає слово з усіх розділів."""
+        with self._lock:
+            for words in self._partitions.values():
+                if words.pop(word_id, None) is not None:
+                    self._size -= 1
+
+    def invalidate(self, lesson_name=None):
+        """Видаляє розділи уроку (і розділи "Всі уроки"); без аргументу очищає весь кеш."""
+        with self._lock:
+            if lesson_name is None:
+                self._partitions.clear()
+                self._size = 0
+                return
+            for key in [key for key in self._partitions if key[0] in (lesson_name, None)]:
+                self._drop(key)
+
+    def _evict(self):
+        """Витісняє найдавніше використані розділи, поки слів більше за max_words."""
+        while self._size > self.max_words:
+            self._drop(next(iter(self._partitions)))
+
+    def _drop(self, key):
+        words = self._partitions.pop(key, None)
+        if words is not None:
+            self._size -= len(words)
@@ -0,0 +1,121 @@
+"""
+Компактні записи слів.
+
+WordRecord зберігає поля у __slots__ замість окремого словника для кожного
+слова, а назва уроку інтернується, тож тисячі слів одного уроку посилаються
+на один рядок. Записи не змінюються після створення: функції запису в db.py
+повертають новий запис, тому кеш, індекси пошуку і списки UI спільно
+використовують ті самі об'єкти без копіювання.
+
+WordColumns — стовпцеве сховище для великих списків лише для читання: рядки
+лежать у двох списках, статус і номер уроку — у масивах, а WordRecord
+створюється лише для елемента, до якого звертаються.
+"""
+import sys
+from array import array
+
+DEFAULT_LESSON = "Головний"
+
+
+def english_key(english):
+    """Англійське слово без урахування регістру.
+
+    Зберігається в документі як english_key: за ним сервер сортує і ділить
+    словник на сторінки, а список у UI сортується так само.
+    """
+    return english.casefold()
+
+
+class WordRecord:
+    """Слово словника: english, translation, learned, lesson та id документа."""
+
+    __slots__ = ("english", "translation", "learned", "lesson", "id")
+
+    def __init__(self, english, translation, learned=False, lesson=DEFAULT_LESSON, id=None):
+        self.english = english
+        self.translation = translation
+        self.learned = learned
+        self.lesson = sys.intern(lesson)
+        self.id = id  # _id документа; однозначно визначає слово в усіх шарах
+
+    @classmethod
+    def from_document(cls, word, lesson=None):
+        """Запис із документа колекції слів.
+
+        Документи зберігають lesson_id, тож назву уроку передає db.py з реєстру
+        уроків; без lesson береться поле lesson документа старого формату.
+        """
+        if lesson is None:
+            lesson = word.get('lesson', DEFAULT_LESSON)
+        return cls(word['english'], word['ukrainian'], word.get('learned', False), lesson, word.get('_id'))
+
+    def replace(self, **changes):
+        """Новий запис зі зміненими полями."""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return WordRecord(**values)
+
+    def _values(self):
+        return (self.english, self.translation, self.learned, self.lesson, self.id)
+
+    def __eq__(self, other):
+        if not isinstance(other, WordRecord):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        return (f"WordRecord({self.english!r}, {self.translation!r}, "
+                f"learned={self.learned!r}, lesson={self.lesson!r}, id={self.id!r})")
+
+
+class WordColumns:
+    """Слова, розкладені по стовпцях; індексація повертає WordRecord."""
+
+    def __init__(self, records=()):
+        self.english = []
+        self.translation = []
+        self.learned = bytearray()
+        self.lesson_ids = array('H')  # Позиції в self.lessons
+        self.ids = []
+        self.lessons = []
+        self._lesson_ids = {}
+        self.extend(records)
+
+    def __len__(self):
+        return len(self.english)
+
+    def append(self, record):
+        lesson_id = self._lesson_ids.get(record.lesson)
+        if lesson_id is None:
+            lesson_id = self._lesson_ids[record.lesson] = len(self.lessons)
+            self.lessons.append(record.lesson)
+        self.english.append(record.english)
+        self.translation.append(record.translation)
+        self.learned.append(bool(record.learned))
+        self.lesson_ids.append(lesson_id)
+        self.ids.append(record.id)
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def record(self, index):
+        return WordRecord(self.english[index], self.translation[index], bool(self.learned[index]),
+                          self.lessons[self.lesson_ids[index]], self.ids[index])
+
+    def __getitem__(self, index):
+        # Зріз повертає список записів, тож контейнер можна передати у VirtualList
+        if isinstance(index, slice):
+            return [self.record(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.record(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.record(index)
@@ -0,0 +1,96 @@
+"""
+Локальний журнал змін, зроблених без підключення до бази.
+
+Кожна зміна — один рядок JSONL (розширений JSON MongoDB, тож ObjectId і дати
+зберігаються без втрат). Рядок дописується в кінець файлу і одразу
+скидається на диск через fsync, тому введене користувачем не губиться навіть
+після аварійного завершення. Після того як db.replay_journal() записав зміни в
+базу, вони прибираються з початку журналу: файл переписується атомарно
+через тимчасовий файл і os.replace.
+
+Запис у журналі описує саму зміну документа, а не виклик функції:
+  {"op": "insert", "doc": {...}}              — нове слово з наперед створеним _id;
+  {"op": "set", "_id": ..., "fields": {...}}  — нові значення полів слова;
+  {"op": "delete", "ids": [...]}              — видалення слів.
+Кожну зміну можна застосувати повторно без наслідків: _id нового слова
+служить ключем ідемпотентності.
+"""
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class WriteJournal:
+    """Журнал змін у файлі path; безпечний для виклику з кількох потоків."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._count = None  # Кількість записів; None — ще не читали файл
+
+    def __len__(self):
+        with self._lock:
+            if self._count is None:
+                self._count = len(self._read())
+            return self._count
+
+    def append(self, entry):
+        """Дописує зміну в журнал і чекає, поки вона потрапить на диск."""
+        from bson import json_util
+
+        line = json_util.dumps(entry) + "\n"
+        with self._lock:
+            if self._count is None:
+                self._count = len(self._read())
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._count += 1
+
+    def entries(self):
+        """Усі зміни в порядку запису."""
+        with self._lock:
+            entries = self._read()
+            self._count = len(entries)
+            return entries
+
+    def discard(self, count):
+        """Прибирає перші count змін, які вже записано в базу."""
+        from bson import json_util
+
+        with self._lock:
+            remaining = self._read()[count:]
+            if not remaining:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                self._count = 0
+                return
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for entry in remaining:
+                    f.write(json_util.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self._count = len(remaining)
+
+    def _read(self):
+        from bson import json_util
+
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json_util.loads(line))
+                except ValueError:
+                    # Недописаний рядок після аварійного завершення
+                    logger.warning("Пошкоджений рядок %d журналу %s пропущено", line_no, self.path)
+        return entries